@@ -4,15 +4,19 @@ AI-Powered Reddit posting with policy compliance and direct posting
 """
 
 import streamlit as st
-import pandas as pd
+import functools
 import json
 import os
 import sys
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from dotenv import load_dotenv
+from streamlit.runtime.scriptrunner import add_script_run_ctx
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
@@ -31,6 +35,10 @@ except ImportError as e:
     st.error(f"Failed to import modules: {e}")
     st.stop()
 
+# Memoize URL validation so Streamlit's keystroke-level reruns don't
+# re-validate the same string
+validate_medium_url = functools.lru_cache(maxsize=256)(validate_medium_url)
+
 # Page configuration
 st.set_page_config(
     page_title="AutoReddit Pro - Enhanced Dashboard",
@@ -39,11 +47,53 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_resource
+def _get_reddit_client():
+    """Construct the Reddit client once per process instead of per rerun"""
+    return get_enhanced_reddit_client()
+
+@st.cache_resource
+def _get_recommender():
+    """Construct the subreddit recommender (rule tables + Groq client) once per process"""
+    return get_enhanced_subreddit_recommender()
+
+@st.cache_resource
+def _get_workflow_manager():
+    """Construct the workflow manager once per process"""
+    return get_workflow_manager()
+
+@st.cache_resource
+def _get_database():
+    """Open the database handle once per process"""
+    return get_database()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _check_reddit_connection() -> bool:
+    """Cached Reddit handshake - avoids a network round-trip on every rerun"""
+    try:
+        return _get_reddit_client().test_connection()
+    except Exception:
+        return False
+
+@st.cache_data(ttl=30)
+def _load_history(limit: int) -> list:
+    """Cached post-history query (PostRow tuples) so tab switches don't re-hit SQLite"""
+    return _get_database().get_post_history(limit=limit)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _check_database() -> bool:
+    """Cached database availability probe"""
+    try:
+        _get_database()
+        return True
+    except Exception:
+        return False
+
 def initialize_session_state():
     """Initialize session state variables"""
     if 'workflow_manager' not in st.session_state:
         try:
-            st.session_state.workflow_manager = get_workflow_manager()
+            st.session_state.workflow_manager = _get_workflow_manager()
         except Exception as e:
             st.session_state.workflow_manager = None
             st.error(f"Failed to initialize workflow manager: {e}")
@@ -52,81 +102,101 @@ def initialize_session_state():
         st.session_state.current_workflow_result = None
     
     if 'posting_history' not in st.session_state:
-        st.session_state.posting_history = []
+        # Bounded, newest-first: appendleft keeps recent posts at the front
+        # without an O(n) slice + reverse on every rerun
+        st.session_state.posting_history = deque(maxlen=200)
 
 def render_header():
     """Render the main header"""
     st.title("🚀 AutoReddit Pro - Enhanced Dashboard")
     st.markdown("**Complete Workflow: URL → Analysis → Recommendations → Policy-Compliant Posts → Direct Posting**")
-    
+
+    # Run the slow status probes concurrently so the header renders in
+    # max(latency) rather than sum(latency)
+    executor = ThreadPoolExecutor(max_workers=2)
+    checks = {
+        "reddit": executor.submit(_check_reddit_connection),
+        "database": executor.submit(_check_database),
+    }
+    # Attach the script run context so the cached checks can run off-thread
+    for thread in executor._threads:
+        add_script_run_ctx(thread)
+    executor.shutdown(wait=False)
+
+    def check_result(name: str) -> bool:
+        try:
+            return checks[name].result(timeout=3)
+        except Exception:
+            return False
+
     # Status indicators
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
         if st.session_state.workflow_manager:
             st.success("✅ Workflow Manager Ready")
         else:
             st.error("❌ Workflow Manager Failed")
-    
+
     with col2:
-        try:
-            reddit_client = get_enhanced_reddit_client()
-            if reddit_client.test_connection():
-                st.success("✅ Reddit Connected")
-            else:
-                st.warning("⚠️ Reddit Connection Issues")
-        except:
-            st.error("❌ Reddit Client Failed")
-    
+        if check_result("reddit"):
+            st.success("✅ Reddit Connected")
+        else:
+            st.warning("⚠️ Reddit Connection Issues")
+
     with col3:
         if os.getenv("GROQ_API_KEY"):
             st.success("✅ AI Ready")
         else:
             st.error("❌ AI Not Configured")
-    
+
     with col4:
-        try:
-            db = get_database()
+        if check_result("database"):
             st.success("✅ Database Ready")
-        except:
+        else:
             st.error("❌ Database Issues")
 
 def render_main_workflow():
     """Render the main workflow interface"""
     st.header("🔄 Complete Reddit Automation Workflow")
-    
-    # Step 1: Article URL Input
-    with st.container():
+
+    # Batch all Step-1 inputs into one form so typing in the URL box or
+    # toggling config widgets doesn't trigger a full script rerun
+    with st.form("workflow_config"):
         st.subheader("📝 Step 1: Enter Article URL")
         article_url = st.text_input(
             "Medium Article URL",
             placeholder="https://medium.com/@yourname/your-article-title",
             help="Enter the URL of your Medium article or blog post"
         )
-        
-        if article_url and not validate_medium_url(article_url):
-            st.error("❌ Please enter a valid article URL (Medium, Dev.to, personal blog, etc.)")
-            return
-    
+
+        # Workflow configuration
+        with st.expander("⚙️ Workflow Configuration", expanded=False):
+            col1, col2 = st.columns(2)
+
+            with col1:
+                max_subreddits = st.slider("Max Subreddit Recommendations", 3, 10, 6)
+                auto_analyze = st.checkbox("Auto-analyze content", value=True)
+
+            with col2:
+                show_compliance_details = st.checkbox("Show policy compliance details", value=True)
+                enable_direct_posting = st.checkbox("Enable direct posting", value=True)
+
+        submitted = st.form_submit_button("🚀 Start Complete Workflow", type="primary", use_container_width=True)
+
+    if not submitted:
+        st.info("👆 Enter an article URL to start the workflow")
+        return
+
     if not article_url:
         st.info("👆 Enter an article URL to start the workflow")
         return
-    
-    # Workflow configuration
-    with st.expander("⚙️ Workflow Configuration", expanded=False):
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            max_subreddits = st.slider("Max Subreddit Recommendations", 3, 10, 6)
-            auto_analyze = st.checkbox("Auto-analyze content", value=True)
-        
-        with col2:
-            show_compliance_details = st.checkbox("Show policy compliance details", value=True)
-            enable_direct_posting = st.checkbox("Enable direct posting", value=True)
-    
-    # Execute workflow button
-    if st.button("🚀 Start Complete Workflow", type="primary", use_container_width=True):
-        execute_complete_workflow(article_url, max_subreddits, show_compliance_details, enable_direct_posting)
+
+    if not validate_medium_url(article_url):
+        st.error("❌ Please enter a valid article URL (Medium, Dev.to, personal blog, etc.)")
+        return
+
+    execute_complete_workflow(article_url, max_subreddits, show_compliance_details, enable_direct_posting)
 
 def execute_complete_workflow(article_url: str, max_subreddits: int, show_compliance_details: bool, enable_direct_posting: bool):
     """Execute the complete workflow"""
@@ -138,29 +208,45 @@ def execute_complete_workflow(article_url: str, max_subreddits: int, show_compli
     # Progress tracking
     progress_bar = st.progress(0)
     status_text = st.empty()
-    
-    # Execute workflow
-    status_text.text("🔄 Executing complete workflow...")
-    
+    stream_area = st.empty()
+
+    # Consume the workflow as a stream so each step and generated post
+    # appears as soon as it is produced instead of after a long blank wait
+    step_names = ["URL Validation", "Content Analysis", "Subreddit Recommendations", "Post Generation"]
+    workflow_result = None
+    streamed_posts = []
+
     try:
-        workflow_result = st.session_state.workflow_manager.execute_complete_workflow(
+        for kind, payload in st.session_state.workflow_manager.stream_workflow(
             article_url=article_url,
-            max_subreddits=max_subreddits,
-            auto_post=False  # We'll handle posting separately
-        )
-        
+            max_subreddits=max_subreddits
+        ):
+            if kind == "step":
+                status_text.text(f"🔄 {payload.step_name}: {payload.status}")
+                if payload.step_name in step_names:
+                    completed = step_names.index(payload.step_name) + 1
+                    progress_bar.progress(int(completed * 100 / len(step_names)))
+            elif kind == "post":
+                streamed_posts.append(payload)
+                with stream_area.container():
+                    st.write(f"📝 Generated {len(streamed_posts)} post(s): "
+                             + ", ".join(f"r/{p['subreddit']}" for p in streamed_posts))
+            elif kind == "result":
+                workflow_result = payload
+
         progress_bar.progress(100)
         status_text.text("✅ Workflow completed!")
-        
+        stream_area.empty()
+
         # Store result
         st.session_state.current_workflow_result = workflow_result
-        
-        if workflow_result.success:
+
+        if workflow_result and workflow_result.success:
             display_workflow_results(workflow_result, show_compliance_details, enable_direct_posting)
-        else:
+        elif workflow_result:
             st.error(f"❌ Workflow failed: {workflow_result.error_message}")
             display_workflow_steps(workflow_result.steps)
-            
+
     except Exception as e:
         progress_bar.progress(0)
         status_text.text(f"❌ Error: {e}")
@@ -208,9 +294,8 @@ def display_workflow_results(workflow_result, show_compliance_details: bool, ena
                     st.write(f"**Subscribers:** {rec['subscribers']:,}")
                     
                     if show_compliance_details and rec.get('rules'):
-                        st.write("**Posting Rules:**")
-                        for rule in rec['rules'][:3]:
-                            st.write(f"• {rule}")
+                        # One markdown call instead of a widget per rule
+                        st.markdown("**Posting Rules:**\n" + "\n".join(f"- {rule}" for rule in rec['rules'][:3]))
                     
                     if rec.get('flair'):
                         st.info(f"📌 Required flair: {rec['flair']}")
@@ -258,6 +343,20 @@ def display_workflow_steps(steps):
                 if step.timestamp:
                     st.write(step.timestamp.strftime("%H:%M:%S"))
 
+def render_body_preview(body: str, preview_chars: int = 800):
+    """Show a truncated post body; the full text stays behind an expander.
+
+    Keeps the per-rerun payload to the browser proportional to the preview
+    size instead of the full body length.
+    """
+    if len(body) <= preview_chars:
+        st.code(body)
+        return
+
+    st.code(body[:preview_chars] + '…')
+    with st.expander("Show full content"):
+        st.code(body)
+
 def display_generated_post(post, enable_direct_posting: bool, article_url: str):
     """Display a generated post with posting options"""
     
@@ -272,28 +371,23 @@ def display_generated_post(post, enable_direct_posting: bool, article_url: str):
         if validation.get('can_post', True):
             st.success("✅ Post ready for submission")
         else:
-            st.error("❌ Post validation failed")
-            for error in validation.get('errors', []):
-                st.error(f"• {error}")
-        
-        # Warnings and suggestions
+            errors = validation.get('errors', [])
+            st.error("\n\n".join(["❌ Post validation failed"] + [f"• {error}" for error in errors]))
+
+        # Warnings and suggestions - one widget per category, not per item
         if validation.get('warnings'):
-            for warning in validation['warnings']:
-                st.warning(f"⚠️ {warning}")
-        
+            st.warning("\n\n".join(f"⚠️ {warning}" for warning in validation['warnings']))
+
         if validation.get('suggestions'):
-            for suggestion in validation['suggestions']:
-                st.info(f"💡 {suggestion}")
+            st.info("\n\n".join(f"💡 {suggestion}" for suggestion in validation['suggestions']))
         
         # Post content
         st.write(f"**Title:** {post['title']}")
-        st.text_area(f"Content for r/{subreddit_name}", post['body'], height=150, disabled=True)
+        render_body_preview(post['body'])
         
         # Compliance info
         if post.get('compliance_notes'):
-            st.write("**Compliance Notes:**")
-            for note in post['compliance_notes']:
-                st.write(f"• {note}")
+            st.markdown("**Compliance Notes:**\n" + "\n".join(f"- {note}" for note in post['compliance_notes']))
         
         if post.get('required_flair'):
             st.info(f"📌 Required flair: {post['required_flair']}")
@@ -318,23 +412,26 @@ def display_generated_post(post, enable_direct_posting: bool, article_url: str):
 
 def post_to_reddit(article_url: str, subreddit_name: str, post_data: Dict):
     """Post content directly to Reddit"""
-    
+
     if not st.session_state.workflow_manager:
         st.error("Workflow manager not available")
         return
-    
+
     if not st.session_state.current_workflow_result:
         st.error("No workflow result available")
         return
-    
-    # Confirmation dialog
-    if not st.session_state.get(f'confirm_post_{subreddit_name}', False):
-        st.warning(f"⚠️ You are about to post to r/{subreddit_name}. This action cannot be undone.")
-        if st.button(f"✅ Confirm Post to r/{subreddit_name}", key=f"confirm_{subreddit_name}"):
-            st.session_state[f'confirm_post_{subreddit_name}'] = True
-            st.rerun()
+
+    # In-place modal confirmation - avoids the session_state flag +
+    # st.rerun() dance that re-executed the whole script per confirmation
+    _confirm_post(article_url, subreddit_name)
+
+@st.dialog("Confirm post")
+def _confirm_post(article_url: str, subreddit_name: str):
+    """Modal confirmation before submitting to Reddit"""
+    st.warning(f"⚠️ You are about to post to r/{subreddit_name}. This action cannot be undone.")
+    if not st.button(f"✅ Confirm Post to r/{subreddit_name}", key=f"confirm_{subreddit_name}"):
         return
-    
+
     # Execute posting
     with st.spinner(f"Posting to r/{subreddit_name}..."):
         try:
@@ -347,18 +444,25 @@ def post_to_reddit(article_url: str, subreddit_name: str, post_data: Dict):
                 st.success(f"🎉 Successfully posted to r/{subreddit_name}!")
                 st.success(f"📱 Post URL: {result['post_url']}")
                 
-                # Add to posting history
-                st.session_state.posting_history.append({
+                # Add to posting history (newest first)
+                st.session_state.posting_history.appendleft({
                     "subreddit": subreddit_name,
                     "url": result['post_url'],
                     "timestamp": datetime.now(),
                     "article_url": article_url
                 })
                 
-                # Reset confirmation
-                if f'confirm_post_{subreddit_name}' in st.session_state:
-                    del st.session_state[f'confirm_post_{subreddit_name}']
-                
+                # The history insert runs off-thread; wait for it to land
+                # before invalidating the cache, or the refreshed view can
+                # miss the new row until the TTL lapses
+                history_write = result.get('history_write')
+                if history_write is not None:
+                    try:
+                        history_write.result(timeout=5)
+                    except Exception:
+                        pass  # already logged by the workflow's done-callback
+                _load_history.clear()
+
             else:
                 st.error(f"❌ Posting failed: {result['error']}")
                 
@@ -372,7 +476,7 @@ def generate_and_preview_post(article_url: str, subreddit_name: str, workflow_re
         st.error("Workflow manager not available")
         return
     
-    recommender = get_enhanced_subreddit_recommender()
+    recommender = _get_recommender()
     
     with st.spinner(f"Generating post for r/{subreddit_name}..."):
         try:
@@ -387,12 +491,10 @@ def generate_and_preview_post(article_url: str, subreddit_name: str, workflow_re
                 # Display preview
                 with st.expander(f"📝 Preview Post for r/{subreddit_name}", expanded=True):
                     st.write(f"**Title:** {post_data['title']}")
-                    st.text_area("Content:", post_data['body'], height=200, disabled=True)
+                    render_body_preview(post_data['body'])
                     
                     if post_data.get('compliance_notes'):
-                        st.write("**Compliance Notes:**")
-                        for note in post_data['compliance_notes']:
-                            st.write(f"• {note}")
+                        st.markdown("**Compliance Notes:**\n" + "\n".join(f"- {note}" for note in post_data['compliance_notes']))
             else:
                 st.error("Failed to generate post")
                 
@@ -404,7 +506,7 @@ def render_posting_history():
     st.subheader("📋 Recent Posting History")
     
     if st.session_state.posting_history:
-        for post in reversed(st.session_state.posting_history[-10:]):  # Show last 10
+        for post in islice(st.session_state.posting_history, 10):  # Show last 10
             with st.expander(f"r/{post['subreddit']} - {post['timestamp'].strftime('%Y-%m-%d %H:%M')}"):
                 st.write(f"**Subreddit:** r/{post['subreddit']}")
                 st.write(f"**Posted:** {post['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}")
@@ -413,57 +515,104 @@ def render_posting_history():
     else:
         st.info("No posting history yet")
 
+def display_large_dataframe(df, page_size: int = 20, key: str = "recent_posts_page"):
+    """Display a dataframe one page at a time so only the visible rows ship to the browser"""
+    # Small frames aren't worth paginating - send them whole
+    if len(df) <= page_size and df.memory_usage(deep=True).sum() < 1e6:
+        st.dataframe(df, use_container_width=True)
+        return
+
+    total_pages = max(1, -(-len(df) // page_size))
+    page = st.number_input("Page", min_value=1, max_value=total_pages, value=1, key=key)
+    start = (page - 1) * page_size
+    st.dataframe(df.iloc[start:start + page_size], use_container_width=True)
+    st.caption(f"Showing rows {start + 1}-{min(start + page_size, len(df))} of {len(df)}")
+
+@st.fragment
+def _render_analytics():
+    """Analytics tab body - runs as a fragment so it reruns independently"""
+    # Deferred so cold start doesn't pay the pandas import tax; sys.modules
+    # caches it, so only the first visit to this tab is slower
+    import pandas as pd
+
+    try:
+        history = _load_history(50)
+
+        if history:
+            df = pd.DataFrame(history)
+            columns = set(df.columns)
+
+            # Metrics (vectorized - no Python-level iteration over rows)
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Total Posts", len(df))
+            with col2:
+                successful = int((df['status'] == 'posted_successfully').sum()) if 'status' in columns else 0
+                st.metric("Successfully Posted", successful)
+            with col3:
+                unique_subs = df['subreddit'].nunique() if 'subreddit' in columns else 0
+                st.metric("Unique Subreddits", unique_subs)
+
+            # Charts - a native dataframe with an in-cell bar is a much
+            # smaller payload than the Vega-Lite pipeline behind st.bar_chart
+            if 'subreddit' in columns and len(df) > 0:
+                st.subheader("Posts by Subreddit")
+                counts = df['subreddit'].value_counts().head(20).reset_index()
+                counts.columns = ['subreddit', 'count']
+                st.dataframe(
+                    counts,
+                    column_config={
+                        "count": st.column_config.ProgressColumn(
+                            "count",
+                            format="%d",
+                            min_value=0,
+                            max_value=int(counts['count'].max()),
+                        )
+                    },
+                    hide_index=True,
+                    use_container_width=True,
+                )
+
+            # Recent posts table
+            st.subheader("Recent Posts")
+            display_cols = ['title', 'subreddit', 'status', 'created_at']
+            available_cols = [col for col in display_cols if col in columns]
+            if available_cols:
+                # Precompute formatting as plain string columns - never attach a
+                # pandas Styler here, its per-cell payload makes the grid render
+                # quadratic on the frontend
+                table = df[available_cols].copy()
+                if 'title' in table.columns:
+                    long_titles = table['title'].str.len() > 60
+                    table['title'] = table['title'].str.slice(0, 60)
+                    table.loc[long_titles, 'title'] += '…'
+                display_large_dataframe(table)
+        else:
+            st.info("No analytics data available yet")
+
+    except Exception as e:
+        st.error(f"Error loading analytics: {e}")
+
 def main():
     """Main application"""
     initialize_session_state()
-    
+
     # Header
     render_header()
-    
+
     # Main tabs
     tab1, tab2, tab3 = st.tabs(["🔄 Complete Workflow", "📊 Analytics", "📋 History"])
-    
+
     with tab1:
         render_main_workflow()
-    
+
     with tab2:
         st.subheader("📊 Analytics Dashboard")
-        try:
-            db = get_database()
-            history = db.get_post_history(limit=50)
-            
-            if history:
-                df = pd.DataFrame(history)
-                
-                # Metrics
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Total Posts", len(history))
-                with col2:
-                    successful = len([h for h in history if h.get('status') == 'posted_successfully'])
-                    st.metric("Successfully Posted", successful)
-                with col3:
-                    if 'subreddit' in df.columns:
-                        st.metric("Unique Subreddits", df['subreddit'].nunique())
-                
-                # Charts
-                if 'subreddit' in df.columns and len(df) > 0:
-                    st.subheader("Posts by Subreddit")
-                    subreddit_counts = df['subreddit'].value_counts()
-                    st.bar_chart(subreddit_counts)
-                
-                # Recent posts table
-                st.subheader("Recent Posts")
-                display_cols = ['title', 'subreddit', 'status', 'created_at']
-                available_cols = [col for col in display_cols if col in df.columns]
-                if available_cols:
-                    st.dataframe(df[available_cols].head(20))
-            else:
-                st.info("No analytics data available yet")
-                
-        except Exception as e:
-            st.error(f"Error loading analytics: {e}")
-    
+        # Lazy-load: skip the DB query + chart build until the user asks for it
+        if st.session_state.get("analytics_opened") or st.button("📈 Load analytics"):
+            st.session_state.analytics_opened = True
+            _render_analytics()
+
     with tab3:
         render_posting_history()
 
@@ -14,10 +14,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from dotenv import load_dotenv
 load_dotenv()
 
-from core.ai_client import get_ai_client
-from core.reddit_client import get_reddit_client
-from core.subreddit_recommender import get_subreddit_recommender
-from core.database import get_database
+# Heavy core imports (AI SDK, recommender, database) are deferred into the
+# subcommand functions below so e.g. `history` doesn't pay the LLM client
+# import cost at startup
 from core.utils import validate_medium_url, extract_article_info
 
 def print_banner():
@@ -27,6 +26,9 @@ def print_banner():
 
 def generate_post(article_url: str, subreddit: str = None) -> None:
     """Generate a post for the given article"""
+    from core.ai_client import get_ai_client
+    from core.database import get_database
+
     try:
         print(f"🔗 Analyzing article: {article_url}")
         
@@ -74,6 +76,8 @@ def generate_post(article_url: str, subreddit: str = None) -> None:
 
 def recommend_subreddits(article_url: str) -> None:
     """Get subreddit recommendations for the article"""
+    from core.subreddit_recommender import get_subreddit_recommender
+
     try:
         print(f"🎯 Finding subreddit recommendations for: {article_url}")
         
@@ -99,6 +103,8 @@ def recommend_subreddits(article_url: str) -> None:
 
 def show_history() -> None:
     """Show post history from database"""
+    from core.database import get_database
+
     try:
         db = get_database()
         history = db.get_post_history(limit=10)
@@ -111,11 +117,11 @@ def show_history() -> None:
         print("-" * 60)
         
         for post in history:
-            print(f"🔗 {post.get('article_url', 'N/A')}")
-            print(f"📍 r/{post.get('subreddit', 'N/A')}")
-            print(f"📝 {post.get('title', 'N/A')[:60]}...")
-            print(f"📅 {post.get('created_at', 'N/A')}")
-            print(f"✅ Status: {post.get('status', 'N/A')}")
+            print(f"🔗 {post.article_url or 'N/A'}")
+            print(f"📍 r/{post.subreddit or 'N/A'}")
+            print(f"📝 {(post.title or 'N/A')[:60]}...")
+            print(f"📅 {post.created_at or 'N/A'}")
+            print(f"✅ Status: {post.status or 'N/A'}")
             print("-" * 40)
         
     except Exception as e:
@@ -141,12 +147,14 @@ def main():
     
     print_banner()
     
-    if args.command == 'generate':
-        generate_post(args.url, args.subreddit)
-    elif args.command == 'recommend':
-        recommend_subreddits(args.url)
-    elif args.command == 'history':
-        show_history()
+    dispatch = {
+        'generate': lambda: generate_post(args.url, args.subreddit),
+        'recommend': lambda: recommend_subreddits(args.url),
+        'history': show_history,
+    }
+
+    if args.command in dispatch:
+        dispatch[args.command]()
     else:
         print("Usage examples:")
         print("  python apps/terminal_automation.py generate https://medium.com/@example/article")
@@ -4,11 +4,14 @@ Each template includes hooks, placeholders, and call-to-action variations.
 Now enhanced with AI integration and fallback templates.
 """
 
+import functools
 import random
+import sys
+from types import MappingProxyType
 from typing import Dict, List, Optional
 
 # Different opening hooks to make posts feel natural
-OPENING_HOOKS = [
+OPENING_HOOKS = (
     "Just published a new article:",
     "Thoughts on this topic I just wrote about:",
     "I recently explored this interesting concept:",
@@ -19,10 +22,10 @@ OPENING_HOOKS = [
     "Wanted to share some insights on:",
     "Recently published my thoughts on:",
     "Here's my take on an important topic:"
-]
+)
 
 # Call-to-action variations (soft approach)
-CALL_TO_ACTIONS = [
+CALL_TO_ACTIONS = (
     "Would love to hear your thoughts!",
     "What's your experience with this?",
     "Curious about your perspective on this.",
@@ -33,7 +36,7 @@ CALL_TO_ACTIONS = [
     "Happy to answer any questions!",
     "Looking forward to the discussion.",
     "What has been your experience?"
-]
+)
 
 # Post templates with placeholders
 POST_TEMPLATES = [
@@ -59,6 +62,36 @@ POST_TEMPLATES = [
     }
 ]
 
+# Precompiled builders for the templates above, keyed by template name.
+# f-strings skip the str.format parser dispatch on the fallback hot path;
+# POST_TEMPLATES keeps the dict form for anything that reads the raw strings.
+TEMPLATE_FUNCS = {
+    "casual_share": (
+        lambda hook, article_title, topic_keyword, summary, link, cta:
+            f"{hook} {article_title}",
+        lambda hook, article_title, topic_keyword, summary, link, cta:
+            f"{summary}\n\n{link}\n\n{cta}",
+    ),
+    "discussion_starter": (
+        lambda hook, article_title, topic_keyword, summary, link, cta:
+            f"{article_title} - {hook}",
+        lambda hook, article_title, topic_keyword, summary, link, cta:
+            f"I recently wrote about {topic_keyword}:\n\n{summary}\n\nFull article: {link}\n\n{cta}",
+    ),
+    "insight_share": (
+        lambda hook, article_title, topic_keyword, summary, link, cta:
+            f"Insights on {topic_keyword}: {article_title}",
+        lambda hook, article_title, topic_keyword, summary, link, cta:
+            f"{hook}\n\n{summary}\n\nRead more: {link}\n\n{cta}",
+    ),
+    "question_based": (
+        lambda hook, article_title, topic_keyword, summary, link, cta:
+            f"{article_title}",
+        lambda hook, article_title, topic_keyword, summary, link, cta:
+            f"{hook}\n\n{summary}\n\nI dive deeper into this in my latest article: {link}\n\n{cta}",
+    ),
+}
+
 # AI-Enhanced template styles that work with AI generation
 AI_TEMPLATE_STYLES = {
     "discussion_starter": {
@@ -83,47 +116,55 @@ AI_TEMPLATE_STYLES = {
     }
 }
 
+# Intern the template/style name strings so the dict probes below (and
+# callers comparing template names) hit the pointer-equality fast path
+AI_TEMPLATE_STYLES = {sys.intern(key): value for key, value in AI_TEMPLATE_STYLES.items()}
+TEMPLATE_FUNCS = {sys.intern(key): value for key, value in TEMPLATE_FUNCS.items()}
+for _template in POST_TEMPLATES:
+    _template["name"] = sys.intern(_template["name"])
+del _template
+
 # Enhanced subreddit configurations for AI context
 ENHANCED_SUBREDDIT_CONFIG = {
     "programming": {
-        "preferred_hooks": [
+        "preferred_hooks": (
             "Just wrote about a coding concept:",
             "Sharing some programming insights:",
             "Explored this development topic:"
-        ],
+        ),
         "topic_keywords": ["coding", "development", "programming", "software"],
         "ai_context": "Technical audience, appreciates code examples and practical solutions",
         "tone": "Professional but approachable, direct communication",
         "avoid": ["Overly promotional language", "Non-technical buzzwords"]
     },
     "webdev": {
-        "preferred_hooks": [
+        "preferred_hooks": (
             "Web development insights:",
             "Just published about web development:",
             "Sharing some frontend/backend knowledge:"
-        ],
+        ),
         "topic_keywords": ["web development", "frontend", "backend", "JavaScript"],
         "ai_context": "Mix of beginners and experts, show-don't-tell approach works well",
         "tone": "Casual but informative, practical examples appreciated",
         "avoid": ["Overly complex jargon without explanation"]
     },
     "entrepreneur": {
-        "preferred_hooks": [
+        "preferred_hooks": (
             "Entrepreneurial insights:",
             "Business lessons learned:",
             "Startup experience shared:"
-        ],
+        ),
         "topic_keywords": ["business", "entrepreneurship", "startup", "growth"],
         "ai_context": "Focus on actionable insights and real experiences",
         "tone": "Authentic, lesson-focused, avoid generic advice",
         "avoid": ["Get-rich-quick schemes", "Generic motivational content"]
     },
     "artificial": {
-        "preferred_hooks": [
+        "preferred_hooks": (
             "AI research insights:",
             "Machine learning findings:",
             "Exploring AI applications:"
-        ],
+        ),
         "topic_keywords": ["artificial intelligence", "machine learning", "AI", "ML"],
         "ai_context": "Technical accuracy crucial, cite sources and methodologies",
         "tone": "Scientific, evidence-based, cite credible sources",
@@ -131,67 +172,98 @@ ENHANCED_SUBREDDIT_CONFIG = {
     }
 }
 
+# Module-private RNG: isolates state from the global random instance and
+# saves the module attribute lookup on every draw
+_rng = random.Random()
+_choice = _rng.choice
+_randrange = _rng.randrange
+
 def get_random_template():
     """Get a random post template"""
-    return random.choice(POST_TEMPLATES)
+    return _choice(POST_TEMPLATES)
 
 def get_random_hook(subreddit=None):
     """Get a random opening hook, optionally subreddit-specific"""
-    import random
-    
-    if subreddit and subreddit.lower() in ENHANCED_SUBREDDIT_CONFIG:
-        preferred_hooks = ENHANCED_SUBREDDIT_CONFIG[subreddit.lower()]["preferred_hooks"]
-        return random.choice(preferred_hooks + OPENING_HOOKS)
-    
-    return random.choice(OPENING_HOOKS)
+    # Single cached lookup replaces the membership test + subscript pair
+    # and the per-call preferred_hooks + OPENING_HOOKS concatenation
+    return _choice(_hook_pool(subreddit.lower() if subreddit else ""))
+
+_CTAS = CALL_TO_ACTIONS
 
 def get_random_cta():
     """Get a random call-to-action"""
-    import random
-    return random.choice(CALL_TO_ACTIONS)
+    return _CTAS[_randrange(len(_CTAS))]
 
+@functools.lru_cache(maxsize=32)
+def _hook_pool(subreddit_lower: str) -> tuple:
+    """Combined hook pool per subreddit, built once instead of per call"""
+    config = ENHANCED_SUBREDDIT_CONFIG.get(subreddit_lower)
+    if config is not None:
+        return tuple(config["preferred_hooks"]) + tuple(OPENING_HOOKS)
+    return tuple(OPENING_HOOKS)
+
+def _pick_post_parts(subreddit) -> tuple:
+    """Draw a hook and CTA with a single RNG state update.
+
+    One randrange over the product space yields two independent uniform
+    picks, halving the Mersenne Twister updates per fallback post.
+    """
+    hooks = _hook_pool(subreddit.lower() if subreddit else "")
+    n = _randrange(len(hooks) * len(CALL_TO_ACTIONS))
+    return hooks[n // len(CALL_TO_ACTIONS)], CALL_TO_ACTIONS[n % len(CALL_TO_ACTIONS)]
+
+# Name -> template index built once, replacing the O(N) scan per lookup
+_TEMPLATE_BY_NAME = {template["name"]: template for template in POST_TEMPLATES}
+
+# First topic keyword per subreddit, precomputed so the fallback path
+# does one dict probe instead of allocating a default list per call
+_DEFAULT_TOPIC = {key: value["topic_keywords"][0] for key, value in ENHANCED_SUBREDDIT_CONFIG.items()}
+_FALLBACK_TOPIC = "topic"
+
+# Bound once; .get(style, expr) would otherwise evaluate this subscript
+# on every call even when the style is known
+_DEFAULT_STYLE_CONFIG = AI_TEMPLATE_STYLES["discussion_starter"]
+
+@functools.lru_cache(maxsize=32)
 def get_ai_fallback_template(style: str = "discussion_starter") -> Dict:
     """
     Get fallback template when AI generation fails
-    
+
     Args:
         style: AI template style that failed
-        
+
     Returns:
         Template dictionary with fallback content
     """
-    style_config = AI_TEMPLATE_STYLES.get(style, AI_TEMPLATE_STYLES["discussion_starter"])
+    style_config = AI_TEMPLATE_STYLES.get(style, _DEFAULT_STYLE_CONFIG)
     fallback_name = style_config["fallback_template"]
-    
-    # Find matching template
-    for template in POST_TEMPLATES:
-        if template["name"] == fallback_name:
-            return template
-    
-    # Ultimate fallback
-    return POST_TEMPLATES[0]
 
+    return _TEMPLATE_BY_NAME.get(fallback_name, POST_TEMPLATES[0])
+
+# Default context for unknown subreddits - built once, shared read-only
+_DEFAULT_AI_CONTEXT = MappingProxyType({
+    "ai_context": "General Reddit audience, focus on providing value",
+    "tone": "Friendly and engaging, avoid overly promotional content",
+    "avoid": ["Spam-like behavior", "Excessive self-promotion"]
+})
+
+@functools.lru_cache(maxsize=32)
 def get_subreddit_ai_context(subreddit: str) -> Dict:
     """
     Get AI context information for specific subreddit
-    
+
     Args:
         subreddit: Target subreddit name
-        
+
     Returns:
-        Dictionary with subreddit-specific AI guidance
+        Read-only mapping with subreddit-specific AI guidance
     """
-    subreddit_lower = subreddit.lower()
-    
-    if subreddit_lower in ENHANCED_SUBREDDIT_CONFIG:
-        return ENHANCED_SUBREDDIT_CONFIG[subreddit_lower]
-    
-    # Default context for unknown subreddits
-    return {
-        "ai_context": "General Reddit audience, focus on providing value",
-        "tone": "Friendly and engaging, avoid overly promotional content",
-        "avoid": ["Spam-like behavior", "Excessive self-promotion"]
-    }
+    config = ENHANCED_SUBREDDIT_CONFIG.get(subreddit.lower())
+    if config is not None:
+        # Read-only view so callers can't mutate the cached config
+        return MappingProxyType(config)
+
+    return _DEFAULT_AI_CONTEXT
 
 def generate_fallback_post(
     article_title: str,
@@ -214,29 +286,32 @@ def generate_fallback_post(
         Dictionary with title and body
     """
     template = get_ai_fallback_template(style)
-    hook = get_random_hook(subreddit)
-    cta = get_random_cta()
+    hook, cta = _pick_post_parts(subreddit)
     
     # Extract topic keyword from summary or title
-    subreddit_config = get_subreddit_ai_context(subreddit)
-    topic_keywords = subreddit_config.get("topic_keywords", ["topic"])
-    topic_keyword = topic_keywords[0]  # Use first as default
-    
-    # Fill template
-    title = template["title"].format(
-        hook=hook,
-        article_title=article_title,
-        topic_keyword=topic_keyword
-    )
+    topic_keyword = _DEFAULT_TOPIC.get(subreddit.lower() if subreddit else "", _FALLBACK_TOPIC)
     
-    body = template["body"].format(
-        hook=hook,
-        summary=summary,
-        link=link,
-        cta=cta,
-        topic_keyword=topic_keyword,
-        article_title=article_title
-    )
+    # Fill template via the precompiled f-string builders; fall back to
+    # str.format only for templates without a registered builder
+    funcs = TEMPLATE_FUNCS.get(template["name"])
+    if funcs:
+        title_fn, body_fn = funcs
+        title = title_fn(hook, article_title, topic_keyword, summary, link, cta)
+        body = body_fn(hook, article_title, topic_keyword, summary, link, cta)
+    else:
+        title = template["title"].format(
+            hook=hook,
+            article_title=article_title,
+            topic_keyword=topic_keyword
+        )
+        body = template["body"].format(
+            hook=hook,
+            summary=summary,
+            link=link,
+            cta=cta,
+            topic_keyword=topic_keyword,
+            article_title=article_title
+        )
     
     return {
         "title": title,
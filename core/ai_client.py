@@ -1,18 +1,40 @@
 """
 Groq AI Client for Reddit Post Generation
 """
+import functools
 import os
+import re
 import time
 import logging
 from typing import Dict, Optional
 from dataclasses import dataclass
 
+# Compiled once - _parse_response runs on every AI response
+_TITLE_RE = re.compile(r'TITLE:\s*(.+)')
+_BODY_RE = re.compile(r'BODY:\s*(.+)', re.DOTALL)
+
+# Static prompt scaffolding interned once; only the dynamic fields are
+# spliced in per call
+_PROMPT_HEAD = "Create a Reddit post for r/"
+_PROMPT_ARTICLE = " about this Medium article:\n\nArticle: "
+_PROMPT_SUMMARY = "\nSummary: "
+_PROMPT_TAIL = """
+
+Generate:
+TITLE: [engaging title under 300 chars]
+BODY: [discussion-focused post body]
+
+Keep it natural and community-focused."""
+
+import asyncio
+
 try:
-    from groq import Groq
+    from groq import Groq, AsyncGroq
     GROQ_AVAILABLE = True
 except ImportError:
     GROQ_AVAILABLE = False
     Groq = None
+    AsyncGroq = None
 
 @dataclass
 class PostGenerationResult:
@@ -24,53 +46,105 @@ class PostGenerationResult:
     token_count: int = 0
     error_message: Optional[str] = None
 
+# Shared message scaffold; per-call dicts are built by merging in the
+# prompt, avoiding a list allocation + resize on every request
+_MSG_TEMPLATE = {"role": "user"}
+
+@functools.lru_cache(maxsize=1)
+def _groq_env():
+    """Read the Groq env config once per process"""
+    return os.getenv("GROQ_API_KEY"), os.getenv("DEFAULT_AI_MODEL", "llama-3.3-70b-versatile")
+
 class GroqAIClient:
     def __init__(self):
-        self.api_key = os.getenv("GROQ_API_KEY")
+        self.api_key, self.default_model = _groq_env()
         if not self.api_key:
             raise ValueError("GROQ_API_KEY required")
         if not GROQ_AVAILABLE:
             raise ImportError("Groq library not installed")
         self.client = Groq(api_key=self.api_key)
-        self.default_model = os.getenv("DEFAULT_AI_MODEL", "llama-3.3-70b-versatile")
+        self.async_client = AsyncGroq(api_key=self.api_key)
     
+    def _build_prompt(self, medium_link: str, summary: str, subreddit: str) -> str:
+        return "".join((
+            _PROMPT_HEAD, subreddit,
+            _PROMPT_ARTICLE, medium_link,
+            _PROMPT_SUMMARY, summary,
+            _PROMPT_TAIL,
+        ))
+
     def generate_reddit_post(self, medium_link: str, summary: str, subreddit: str, style: str = "discussion") -> PostGenerationResult:
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
-            prompt = f"""Create a Reddit post for r/{subreddit} about this Medium article:
-
-Article: {medium_link}
-Summary: {summary}
-
-Generate:
-TITLE: [engaging title under 300 chars]
-BODY: [discussion-focused post body]
-
-Keep it natural and community-focused."""
+            prompt = self._build_prompt(medium_link, summary, subreddit)
             response = self.client.chat.completions.create(
                 model=self.default_model,
-                messages=[{"role": "user", "content": prompt}],
+                messages=({**_MSG_TEMPLATE, "content": prompt},),
                 max_tokens=1000,
                 temperature=0.7
             )
             result_text = response.choices[0].message.content
             title, body = self._parse_response(result_text)
-            token_count = getattr(response.usage, 'total_tokens', 0) if hasattr(response, 'usage') else 0
+            try:
+                token_count = response.usage.total_tokens
+            except AttributeError:
+                token_count = 0
             return PostGenerationResult(
                 title=title,
                 body=body,
                 success=True,
                 model_used=self.default_model,
-                generation_time=time.time() - start_time,
+                generation_time=time.perf_counter() - start_time,
                 token_count=token_count
             )
         except Exception as e:
             return PostGenerationResult(
                 success=False,
                 error_message=str(e),
-                generation_time=time.time() - start_time
+                generation_time=time.perf_counter() - start_time
             )
     
+    async def generate_reddit_post_async(self, medium_link: str, summary: str, subreddit: str, style: str = "discussion") -> PostGenerationResult:
+        """Async variant of generate_reddit_post for concurrent generation"""
+        start_time = time.perf_counter()
+        try:
+            prompt = self._build_prompt(medium_link, summary, subreddit)
+            response = await self.async_client.chat.completions.create(
+                model=self.default_model,
+                messages=({**_MSG_TEMPLATE, "content": prompt},),
+                max_tokens=1000,
+                temperature=0.7
+            )
+            result_text = response.choices[0].message.content
+            title, body = self._parse_response(result_text)
+            try:
+                token_count = response.usage.total_tokens
+            except AttributeError:
+                token_count = 0
+            return PostGenerationResult(
+                title=title,
+                body=body,
+                success=True,
+                model_used=self.default_model,
+                generation_time=time.perf_counter() - start_time,
+                token_count=token_count
+            )
+        except Exception as e:
+            return PostGenerationResult(
+                success=False,
+                error_message=str(e),
+                generation_time=time.perf_counter() - start_time
+            )
+
+    async def generate_many(self, jobs: list) -> list:
+        """Generate posts for several jobs concurrently.
+
+        Each job is a kwargs dict for generate_reddit_post_async; requests
+        overlap on the wire so N posts cost roughly one round-trip.
+        Sync callers use asyncio.run(client.generate_many(jobs)).
+        """
+        return await asyncio.gather(*(self.generate_reddit_post_async(**job) for job in jobs))
+
     def generate_post(self, article_url: str, article_title: str, article_summary: str, subreddit: str = "programming") -> Dict:
         """Generate a post for the given article - compatible with both old and new interfaces"""
         result = self.generate_reddit_post(article_url, article_summary, subreddit)
@@ -83,9 +157,8 @@ Keep it natural and community-focused."""
         }
     
     def _parse_response(self, text: str) -> tuple:
-        import re
-        title_match = re.search(r'TITLE:\s*(.+)', text)
-        body_match = re.search(r'BODY:\s*(.+)', text, re.DOTALL)
+        title_match = _TITLE_RE.search(text)
+        body_match = _BODY_RE.search(text)
         title = title_match.group(1).strip() if title_match else "Article Discussion"
         body = body_match.group(1).strip() if body_match else text
         return title, body
@@ -2,17 +2,33 @@
 Database operations
 """
 import sqlite3
-from typing import Dict, List
+import threading
+from collections import namedtuple
+from typing import List
+
+# Lightweight row type: a fraction of a dict's footprint per row and
+# attribute access for callers; use _asdict() where a dict is needed
+PostRow = namedtuple("PostRow", "id article_url title content subreddit status created_at")
 
 class RedditDatabase:
+    # Identical SQL text on every call keeps sqlite3's statement cache hot
+    _INSERT_SQL = "INSERT INTO posts (article_url, title, content, subreddit, status) VALUES (?, ?, ?, ?, ?)"
+
     def __init__(self, db_path: str = "data/reddit_posts.db"):
         self.db_path = db_path
+        # One long-lived autocommit connection reused across calls; a lock
+        # serializes access since sqlite3 connections aren't thread-safe
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA cache_size=-64000")
         self.init_database()
-    
+
     def init_database(self):
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock:
             # Create the table with all columns
-            conn.execute("""
+            self._conn.execute("""
                 CREATE TABLE IF NOT EXISTS posts (
                     id INTEGER PRIMARY KEY,
                     article_url TEXT,
@@ -23,17 +39,31 @@ class RedditDatabase:
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
-            
+
+            # Lets get_post_history stream rows in index order and stop at
+            # LIMIT instead of scanning and sorting the whole table
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_posts_created_desc ON posts(created_at DESC)"
+            )
+
             # Migrate existing database if needed
-            self._migrate_database(conn)
-    
+            self._migrate_database(self._conn)
+
+    # Bump when _migrate_database learns a new step
+    _SCHEMA_VERSION = 1
+
     def _migrate_database(self, conn):
         """Migrate existing database to new schema"""
         try:
+            # Already migrated - skip the table_info/ALTER dance entirely
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= self._SCHEMA_VERSION:
+                return
+
             # Check if new columns exist
             cursor = conn.execute("PRAGMA table_info(posts)")
             columns = [column[1] for column in cursor.fetchall()]
-            
+
             # Add missing columns
             if 'article_url' not in columns:
                 conn.execute("ALTER TABLE posts ADD COLUMN article_url TEXT")
@@ -41,26 +71,37 @@ class RedditDatabase:
                 conn.execute("ALTER TABLE posts ADD COLUMN content TEXT")
             if 'status' not in columns:
                 conn.execute("ALTER TABLE posts ADD COLUMN status TEXT DEFAULT 'generated'")
-                
+
+            conn.execute(f"PRAGMA user_version = {self._SCHEMA_VERSION}")
+
         except sqlite3.Error as e:
             print(f"Migration warning: {e}")
-    
+
     def add_post_history(self, article_url: str = "", subreddit: str = "", title: str = "", content: str = "", status: str = "pending", **kwargs) -> int:
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "INSERT INTO posts (article_url, title, content, subreddit, status) VALUES (?, ?, ?, ?, ?)",
+        with self._lock:
+            cursor = self._conn.execute(
+                self._INSERT_SQL,
                 (article_url, title, content, subreddit, status)
             )
             return cursor.lastrowid
-    
-    def get_post_history(self, limit: int = 50) -> List[Dict]:
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM posts ORDER BY created_at DESC LIMIT ?",
+
+    def add_post_history_many(self, rows: List[tuple]) -> None:
+        """Bulk insert (article_url, title, content, subreddit, status) rows.
+
+        executemany amortizes statement setup over the batch instead of
+        paying it once per row.
+        """
+        with self._lock:
+            self._conn.executemany(self._INSERT_SQL, rows)
+
+    def get_post_history(self, limit: int = 50) -> List[PostRow]:
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT id, article_url, title, content, subreddit, status, created_at"
+                " FROM posts ORDER BY created_at DESC LIMIT ?",
                 (limit,)
             )
-            return [dict(row) for row in cursor.fetchall()]
+            return [PostRow._make(row) for row in cursor.fetchall()]
 
 db = RedditDatabase()
 
@@ -1,11 +1,18 @@
 """
 Enhanced Reddit Client with Direct Posting and Policy Compliance
 """
+import asyncio
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
+import re
 import time
 from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass
 
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
 try:
     import praw
     PRAW_AVAILABLE = True
@@ -13,7 +20,51 @@ except ImportError:
     PRAW_AVAILABLE = False
     praw = None
 
-@dataclass
+# One keepalive connection pool shared by every PRAW instance this
+# module creates; reinitializing the client no longer re-pays the TLS
+# handshake, and Retry-After/backoff handling lives in one place
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+))
+
+try:
+    import asyncpraw
+    ASYNCPRAW_AVAILABLE = True
+except ImportError:
+    ASYNCPRAW_AVAILABLE = False
+    asyncpraw = None
+
+# Friendly rewrites for the Reddit API error codes we hit most often
+_ERR_MAP = {
+    "SUBMIT_VALIDATION_FLAIR_REQUIRED": "This subreddit requires post flair. Please add appropriate flair.",
+    "NO_SELFS": "This subreddit doesn't allow text posts.",
+    "SUBMIT_VALIDATION_BODY_NOT_ALLOWED": "This subreddit doesn't allow body text in posts.",
+    "RATELIMIT": "Rate limited. Please wait before posting again.",
+    "SUBREDDIT_NOTALLOWED": "You don't have permission to post in this subreddit.",
+}
+
+# Promotion/spam phrase lists compiled once into single alternations so
+# each validation makes one C-level pass over the body instead of one
+# scan per phrase
+_PROMO_RE = re.compile(r"my blog|my website|check out my|subscribe to")
+_SPAM_RE = re.compile(r"click here|buy now|limited time|act fast")
+
+def _ratelimit_delay(error) -> Optional[float]:
+    """Seconds Reddit asked us to wait, or None if not a rate-limit error"""
+    items = getattr(error, 'items', None)
+    if not items:
+        return None
+    for item in items:
+        if getattr(item, 'error_type', '') == 'RATELIMIT':
+            return getattr(error, 'sleep_time', None) or 60
+    return None
+
+# slots=True drops the per-instance __dict__; these are built on every
+# submission/validation so the smaller, faster instances add up
+@dataclass(slots=True)
 class PostResult:
     success: bool = False
     post_id: Optional[str] = None
@@ -21,7 +72,7 @@ class PostResult:
     error_message: Optional[str] = None
     submission_object: Optional[object] = None
 
-@dataclass
+@dataclass(slots=True)
 class SubredditInfo:
     name: str
     display_name: str
@@ -34,9 +85,18 @@ class SubredditInfo:
     over18: bool
 
 class EnhancedRedditClient:
+    # Subreddit metadata changes on the order of hours; a short TTL cache
+    # turns the repeated per-submission lookups into dict hits
+    SUB_INFO_TTL = 900
+
     def __init__(self):
         if not PRAW_AVAILABLE:
             raise ImportError("PRAW library not installed")
+
+        self._sub_cache = {}
+        # (fetch timestamp, newest submission id, rows) for the
+        # ETag-style history guard below
+        self._history_cache = None
         
         # Try to initialize Reddit client with error handling
         try:
@@ -45,23 +105,31 @@ class EnhancedRedditClient:
                 client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
                 username=os.getenv("REDDIT_USERNAME"),
                 password=os.getenv("REDDIT_PASSWORD"),
-                user_agent=os.getenv("REDDIT_USER_AGENT", "reddit_automation_bot_1.0")
+                user_agent=os.getenv("REDDIT_USER_AGENT", "reddit_automation_bot_1.0"),
+                requestor_kwargs={"session": _HTTP}
             )
             self.client = self.reddit  # Add alias for compatibility
             self.username = os.getenv("REDDIT_USERNAME")
-            
-            # Test connection
-            try:
-                self.reddit.user.me()
-            except Exception as e:
-                print(f"Warning: Reddit connection test failed: {e}")
-                
+            # Auth is verified lazily on the first real call (see
+            # ensure_auth) so process startup doesn't pay a round trip
+            self._auth_checked = False
+
         except Exception as e:
             print(f"Warning: Could not initialize Reddit client: {e}")
             self.reddit = None
             self.client = None
             self.username = None
     
+    def ensure_auth(self):
+        """Run the deferred connection test once before the first write"""
+        if self._auth_checked:
+            return
+        self._auth_checked = True
+        try:
+            self.reddit.user.me()
+        except Exception as e:
+            print(f"Warning: Reddit connection test failed: {e}")
+
     def test_connection(self) -> bool:
         """Test Reddit API connection"""
         try:
@@ -71,10 +139,54 @@ class EnhancedRedditClient:
             print(f"Connection test failed: {e}")
             return False
     
+    def _cache_get(self, key: str):
+        entry = self._sub_cache.get(key)
+        if entry is not None and time.time() - entry[0] < self.SUB_INFO_TTL:
+            return entry[1]
+        return None
+
+    def _cache_put(self, key: str, value):
+        now = time.time()
+        self._sub_cache[key] = (now, value)
+        # Opportunistically drop anything stale so the dict stays small
+        for stale in [k for k, (ts, _) in self._sub_cache.items() if now - ts >= self.SUB_INFO_TTL]:
+            del self._sub_cache[stale]
+
+    def _respect_ratelimit(self):
+        """Sleep until Reddit's rate-limit window resets if we're out.
+
+        PRAW surfaces the X-Ratelimit-* response headers via
+        reddit.auth.limits; pausing here avoids burning a request on a
+        guaranteed 429 during bulk posting.
+        """
+        try:
+            limits = self.reddit.auth.limits
+            remaining = limits.get('remaining')
+            reset_timestamp = limits.get('reset_timestamp')
+        except Exception:
+            return
+        if remaining is not None and remaining < 2 and reset_timestamp:
+            delay = reset_timestamp - time.time()
+            if delay > 0:
+                time.sleep(delay)
+
+    def invalidate(self, subreddit_name: str):
+        """Drop cached metadata for a subreddit (e.g. after posting)"""
+        self._sub_cache.pop(f"detailed:{subreddit_name}", None)
+        self._sub_cache.pop(f"basic:{subreddit_name}", None)
+
     def get_detailed_subreddit_info(self, subreddit_name: str) -> SubredditInfo:
         """Get detailed information about a subreddit"""
+        cached = self._cache_get(f"detailed:{subreddit_name}")
+        if cached is not None:
+            return cached
+
+        self._respect_ratelimit()
         try:
             subreddit = self.reddit.subreddit(subreddit_name)
+            # Load all scalar fields in one request up front; otherwise
+            # each lazy attribute access below can trigger its own fetch
+            subreddit._fetch()
             
             # Get available flairs
             available_flairs = []
@@ -101,7 +213,7 @@ class EnhancedRedditClient:
                 "min_karma": 0
             }
             
-            return SubredditInfo(
+            info = SubredditInfo(
                 name=subreddit_name,
                 display_name=subreddit.display_name,
                 subscribers=subreddit.subscribers or 0,
@@ -112,6 +224,8 @@ class EnhancedRedditClient:
                 posting_allowed=True,
                 over18=subreddit.over18 or False
             )
+            self._cache_put(f"detailed:{subreddit_name}", info)
+            return info
             
         except Exception as e:
             return SubredditInfo(
@@ -126,8 +240,57 @@ class EnhancedRedditClient:
                 over18=False
             )
     
-    def validate_post_before_submission(self, subreddit_name: str, title: str, body: str, flair: str = None) -> Dict:
-        """Validate post before submission to check for potential issues"""
+    @staticmethod
+    def _validate_local(title: str, body: str, validation_result: Dict):
+        """Checks that need no subreddit metadata (and no network)"""
+        # One pass over each string up front; every check below reads
+        # these locals instead of re-traversing title/body. The remaining
+        # scans (count, isupper, the regex search) are each a single
+        # C-level pass already - fusing them in Python would be slower.
+        title_len = len(title)
+        body_lower = body.lower()
+
+        # Check title length
+        if title_len > 300:
+            validation_result["warnings"].append("Title is very long (>300 chars)")
+        elif title_len < 10:
+            validation_result["warnings"].append("Title might be too short")
+
+        # Check body length
+        if len(body) > 40000:
+            validation_result["warnings"].append("Post body is very long")
+
+        # Content quality checks
+        if title.count('!') > 3:
+            validation_result["suggestions"].append("Reduce exclamation marks in title")
+
+        if title.isupper():
+            validation_result["suggestions"].append("Avoid all caps in title")
+
+        # Self-promotion detection
+        if _PROMO_RE.search(body_lower):
+            validation_result["warnings"].append("Content might be seen as self-promotion")
+
+    def _validate_against_subreddit(self, subreddit_name: str, flair, validation_result: Dict):
+        """Checks that need subreddit metadata (one potential fetch)"""
+        subreddit_info = self.get_detailed_subreddit_info(subreddit_name)
+
+        # Check if posting is allowed
+        if not subreddit_info.posting_allowed:
+            validation_result["can_post"] = False
+            validation_result["errors"].append("Posting not allowed in this subreddit")
+
+        # Check flair requirements
+        if subreddit_info.submission_requirements.get("requires_flair", False):
+            if not flair and subreddit_info.available_flairs:
+                validation_result["warnings"].append(f"Consider adding flair. Available: {', '.join(subreddit_info.available_flairs[:3])}")
+
+    def validate_post_before_submission(self, subreddit_name: str, title: str, body: str, flair: str = None, network: bool = True) -> Dict:
+        """Validate post before submission to check for potential issues.
+
+        The local checks are free; pass network=False for a dry run that
+        skips the subreddit-metadata fetch entirely.
+        """
         validation_result = {
             "can_post": True,
             "warnings": [],
@@ -136,39 +299,9 @@ class EnhancedRedditClient:
         }
         
         try:
-            subreddit_info = self.get_detailed_subreddit_info(subreddit_name)
-            
-            # Check if posting is allowed
-            if not subreddit_info.posting_allowed:
-                validation_result["can_post"] = False
-                validation_result["errors"].append("Posting not allowed in this subreddit")
-            
-            # Check title length
-            if len(title) > 300:
-                validation_result["warnings"].append("Title is very long (>300 chars)")
-            elif len(title) < 10:
-                validation_result["warnings"].append("Title might be too short")
-            
-            # Check body length
-            if len(body) > 40000:
-                validation_result["warnings"].append("Post body is very long")
-            
-            # Check flair requirements
-            if subreddit_info.submission_requirements.get("requires_flair", False):
-                if not flair and subreddit_info.available_flairs:
-                    validation_result["warnings"].append(f"Consider adding flair. Available: {', '.join(subreddit_info.available_flairs[:3])}")
-            
-            # Content quality checks
-            if title.count('!') > 3:
-                validation_result["suggestions"].append("Reduce exclamation marks in title")
-            
-            if title.isupper():
-                validation_result["suggestions"].append("Avoid all caps in title")
-            
-            # Self-promotion detection
-            if any(word in body.lower() for word in ['my blog', 'my website', 'check out my', 'subscribe to']):
-                validation_result["warnings"].append("Content might be seen as self-promotion")
-            
+            self._validate_local(title, body, validation_result)
+            if network and subreddit_name:
+                self._validate_against_subreddit(subreddit_name, flair, validation_result)
             return validation_result
             
         except Exception as e:
@@ -196,18 +329,47 @@ class EnhancedRedditClient:
         
         return self.submit_post(subreddit_name, title, body, flair)
     
+    def submit_posts_bulk(self, jobs: List[tuple]) -> List[PostResult]:
+        """Validate and submit several (subreddit, title, body, flair) jobs.
+
+        PRAW releases the GIL during I/O, so a small thread pool overlaps
+        the per-subreddit round trips; results come back in job order.
+        The rate-limit gate in submit_post keeps workers from stampeding
+        past Reddit's window.
+        """
+        if not jobs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+            return list(executor.map(lambda job: self.submit_post_with_validation(*job), jobs))
+
     def submit_post(self, subreddit_name: str, title: str, body: str, flair: str = None) -> PostResult:
         """Submit a post to Reddit"""
+        self.ensure_auth()
+        self._respect_ratelimit()
         try:
             subreddit = self.reddit.subreddit(subreddit_name)
             
             # Submit the post
-            submission = subreddit.submit(
-                title=title,
-                selftext=body,
-                flair_id=None,  # We'll set flair separately if needed
-                send_replies=True
-            )
+            try:
+                submission = subreddit.submit(
+                    title=title,
+                    selftext=body,
+                    flair_id=None,  # We'll set flair separately if needed
+                    send_replies=True
+                )
+            except Exception as submit_error:
+                # Reddit tells us exactly how long to wait on RATELIMIT;
+                # sleep that long and retry once instead of failing
+                delay = _ratelimit_delay(submit_error)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                submission = subreddit.submit(
+                    title=title,
+                    selftext=body,
+                    flair_id=None,
+                    send_replies=True
+                )
             
             # Set flair if provided
             if flair:
@@ -217,6 +379,10 @@ class EnhancedRedditClient:
                 except Exception as flair_error:
                     print(f"Warning: Could not set flair '{flair}': {flair_error}")
             
+            # Flair requirements etc. may look different after we've
+            # posted - let the next validation refetch
+            self.invalidate(subreddit_name)
+
             return PostResult(
                 success=True,
                 post_id=submission.id,
@@ -225,19 +391,9 @@ class EnhancedRedditClient:
             )
             
         except Exception as e:
-            error_msg = str(e)
-            
-            # Parse common Reddit errors
-            if "SUBMIT_VALIDATION_FLAIR_REQUIRED" in error_msg:
-                error_msg = "This subreddit requires post flair. Please add appropriate flair."
-            elif "NO_SELFS" in error_msg:
-                error_msg = "This subreddit doesn't allow text posts."
-            elif "SUBMIT_VALIDATION_BODY_NOT_ALLOWED" in error_msg:
-                error_msg = "This subreddit doesn't allow body text in posts."
-            elif "RATELIMIT" in error_msg:
-                error_msg = "Rate limited. Please wait before posting again."
-            elif "SUBREDDIT_NOTALLOWED" in error_msg:
-                error_msg = "You don't have permission to post in this subreddit."
+            raw = str(e)
+            # Parse common Reddit errors via the table above
+            error_msg = next((message for code, message in _ERR_MAP.items() if code in raw), raw)
             
             return PostResult(
                 success=False,
@@ -264,6 +420,7 @@ class EnhancedRedditClient:
     
     def check_user_permissions(self, subreddit_name: str) -> Dict:
         """Check user's permissions in a subreddit"""
+        self.ensure_auth()
         try:
             subreddit = self.reddit.subreddit(subreddit_name)
             
@@ -276,18 +433,20 @@ class EnhancedRedditClient:
                 "karma_sufficient": True
             }
             
-            # Check if user is banned (this might raise an exception)
+            # Ask Reddit for just our user instead of paging through the
+            # full banned/moderator listings
             try:
-                # Try to get user's flair (will fail if banned)
-                subreddit.flair(self.username)
+                if any(True for _ in subreddit.banned(redditor=self.username)):
+                    permissions["is_banned"] = True
+                    permissions["can_submit"] = False
             except Exception:
-                permissions["is_banned"] = True
-                permissions["can_submit"] = False
-            
+                pass
+
             # Check if user is moderator
             try:
-                moderators = list(subreddit.moderator())
-                permissions["is_moderator"] = any(mod.name == self.username for mod in moderators)
+                permissions["is_moderator"] = any(
+                    True for _ in subreddit.moderator(redditor=self.username)
+                )
             except:
                 pass
             
@@ -296,15 +455,38 @@ class EnhancedRedditClient:
         except Exception as e:
             return {"error": f"Could not check permissions: {e}"}
     
+    # Serve history straight from cache for this long before even the
+    # cheap newest-id probe
+    HISTORY_TTL = 60
+
     def get_user_post_history(self, limit: int = 10) -> List[Dict]:
-        """Get user's recent post history"""
+        """Get user's recent post history.
+
+        Works like an ETag check: after the first fetch, a single
+        newest-submission probe decides whether anything changed; if not
+        the cached rows are returned without rebuilding the listing.
+        """
+        now = time.time()
+        cached = self._history_cache
+        if cached is not None and now - cached[0] < self.HISTORY_TTL and len(cached[2]) >= limit:
+            return cached[2][:limit]
+
+        self.ensure_auth()
+        self._respect_ratelimit()
         try:
             user = self.reddit.user.me()
-            submissions = list(user.submissions.new(limit=limit))
-            
-            history = []
-            for submission in submissions:
-                history.append({
+
+            if cached is not None and len(cached[2]) >= limit:
+                newest = next(user.submissions.new(limit=1), None)
+                if newest is not None and newest.id == cached[1]:
+                    self._history_cache = (now, cached[1], cached[2])
+                    return cached[2][:limit]
+
+            # Single streamed pass over the listing; no intermediate
+            # submissions list. display_name comes with the listing
+            # payload, so no lazy per-row fetch either.
+            history = [
+                {
                     "id": submission.id,
                     "title": submission.title,
                     "subreddit": submission.subreddit.display_name,
@@ -312,8 +494,11 @@ class EnhancedRedditClient:
                     "num_comments": submission.num_comments,
                     "created_utc": submission.created_utc,
                     "url": f"https://reddit.com{submission.permalink}"
-                })
-            
+                }
+                for submission in user.submissions.new(limit=limit)
+            ]
+
+            self._history_cache = (now, history[0]["id"] if history else None, history)
             return history
             
         except Exception as e:
@@ -323,10 +508,14 @@ class EnhancedRedditClient:
         """Get basic subreddit information (compatible interface)"""
         if not self.reddit:
             return {"error": "Reddit client not initialized"}
-            
+
+        cached = self._cache_get(f"basic:{subreddit_name}")
+        if cached is not None:
+            return cached
+
         try:
             subreddit = self.reddit.subreddit(subreddit_name)
-            return {
+            info = {
                 "name": subreddit_name,
                 "display_name": subreddit.display_name,
                 "subscribers": subreddit.subscribers,
@@ -335,6 +524,8 @@ class EnhancedRedditClient:
                 "can_assign_link_flair": subreddit.can_assign_link_flair,
                 "submission_type": subreddit.submission_type
             }
+            self._cache_put(f"basic:{subreddit_name}", info)
+            return info
         except Exception as e:
             return {"error": str(e)}
     
@@ -354,6 +545,7 @@ class EnhancedRedditClient:
     def validate_post_content(self, content: str, title: str, subreddit_name: str) -> Tuple[bool, List[str]]:
         """Validate post content against subreddit rules"""
         issues = []
+        content_lower = content.lower()
         
         # Basic validation
         if len(title) > 300:
@@ -364,12 +556,11 @@ class EnhancedRedditClient:
             issues.append("Title cannot be empty")
         
         # Content quality checks
-        if content.count("http") > 5:
+        if content_lower.count("http") > 5:
             issues.append("Too many links in content")
         
         # Spam-like patterns
-        spam_indicators = ["click here", "buy now", "limited time", "act fast"]
-        spam_count = sum(1 for indicator in spam_indicators if indicator.lower() in content.lower())
+        spam_count = len(set(_SPAM_RE.findall(content_lower)))
         if spam_count > 2:
             issues.append("Content appears promotional")
         
@@ -394,12 +585,149 @@ class EnhancedRedditClient:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-# Global instance
-_enhanced_reddit_client = None
+class AsyncEnhancedRedditClient:
+    """Async variant of EnhancedRedditClient built on asyncpraw.
+
+    The workload is I/O-bound, so awaiting the Reddit calls lets callers
+    fan out many subreddit/user lookups concurrently instead of paying
+    one round trip at a time. Construct with `await
+    AsyncEnhancedRedditClient.create()`; sync callers can wrap a single
+    call in asyncio.run(...).
+    """
+
+    def __init__(self, reddit):
+        self.reddit = reddit
+        self.client = reddit  # Alias for compatibility
+        self.username = os.getenv("REDDIT_USERNAME")
+
+    @classmethod
+    async def create(cls) -> "AsyncEnhancedRedditClient":
+        if not ASYNCPRAW_AVAILABLE:
+            raise ImportError("asyncpraw library not installed")
+
+        reddit = asyncpraw.Reddit(
+            client_id=os.getenv("REDDIT_CLIENT_ID"),
+            client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
+            username=os.getenv("REDDIT_USERNAME"),
+            password=os.getenv("REDDIT_PASSWORD"),
+            user_agent=os.getenv("REDDIT_USER_AGENT", "reddit_automation_bot_1.0")
+        )
+        return cls(reddit)
+
+    async def close(self):
+        await self.reddit.close()
+
+    @staticmethod
+    async def _fetch_flairs(subreddit) -> List[str]:
+        try:
+            return [flair['text'] async for flair in subreddit.flair.link_templates]
+        except Exception:
+            return []
+
+    @staticmethod
+    async def _fetch_rules(subreddit) -> List[str]:
+        try:
+            return [rule.short_name async for rule in subreddit.rules]
+        except Exception:
+            return []
+
+    async def get_detailed_subreddit_info(self, subreddit_name: str) -> SubredditInfo:
+        """Get detailed information about a subreddit"""
+        try:
+            subreddit = await self.reddit.subreddit(subreddit_name)
+            # The flair and rules listings are independent round trips -
+            # overlap them instead of paying them sequentially
+            available_flairs, rules, _ = await asyncio.gather(
+                self._fetch_flairs(subreddit),
+                self._fetch_rules(subreddit),
+                subreddit.load(),
+            )
+
+            submission_requirements = {
+                "text_posts_allowed": True,
+                "link_posts_allowed": True,
+                "requires_flair": len(available_flairs) > 0,
+                "min_account_age": 0,
+                "min_karma": 0
+            }
+
+            return SubredditInfo(
+                name=subreddit_name,
+                display_name=subreddit.display_name,
+                subscribers=subreddit.subscribers or 0,
+                description=subreddit.description[:200] if subreddit.description else "",
+                rules=rules,
+                available_flairs=available_flairs,
+                submission_requirements=submission_requirements,
+                posting_allowed=True,
+                over18=subreddit.over18 or False
+            )
+
+        except Exception as e:
+            return SubredditInfo(
+                name=subreddit_name,
+                display_name=subreddit_name,
+                subscribers=0,
+                description=f"Error getting info: {e}",
+                rules=[],
+                available_flairs=[],
+                submission_requirements={},
+                posting_allowed=False,
+                over18=False
+            )
+
+    async def submit_post(self, subreddit_name: str, title: str, body: str, flair: str = None) -> PostResult:
+        """Submit a post to Reddit"""
+        try:
+            subreddit = await self.reddit.subreddit(subreddit_name)
+            submission = await subreddit.submit(
+                title=title,
+                selftext=body,
+                flair_id=None,
+                send_replies=True
+            )
+
+            if flair:
+                try:
+                    await submission.flair.select(flair)
+                except Exception as flair_error:
+                    print(f"Warning: Could not set flair '{flair}': {flair_error}")
+
+            return PostResult(
+                success=True,
+                post_id=submission.id,
+                post_url=f"https://reddit.com{submission.permalink}",
+                submission_object=submission
+            )
+
+        except Exception as e:
+            return PostResult(success=False, error_message=str(e))
+
+    async def get_user_post_history(self, limit: int = 10) -> List[Dict]:
+        """Get user's recent post history"""
+        try:
+            user = await self.reddit.user.me()
+            return [
+                {
+                    "id": submission.id,
+                    "title": submission.title,
+                    "subreddit": submission.subreddit.display_name,
+                    "score": submission.score,
+                    "num_comments": submission.num_comments,
+                    "created_utc": submission.created_utc,
+                    "url": f"https://reddit.com{submission.permalink}"
+                }
+                async for submission in user.submissions.new(limit=limit)
+            ]
+        except Exception as e:
+            return [{"error": f"Could not get post history: {e}"}]
+
+@functools.lru_cache(maxsize=1)
+def get_enhanced_reddit_client() -> EnhancedRedditClient:
+    """Get the enhanced Reddit client instance.
 
-def get_enhanced_reddit_client():
-    """Get the enhanced Reddit client instance"""
-    global _enhanced_reddit_client
-    if _enhanced_reddit_client is None:
-        _enhanced_reddit_client = EnhancedRedditClient()
-    return _enhanced_reddit_client
+    lru_cache makes first-call construction atomic under threads, so two
+    concurrent callers can't each build their own client (and connection
+    pool). Call .cache_clear() after rotating credentials.
+    """
+    return EnhancedRedditClient()
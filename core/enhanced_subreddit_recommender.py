@@ -1,17 +1,79 @@
 """
 Enhanced Subreddit Recommender with Policy Compliance
 """
+import asyncio
+import functools
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+import json
 import os
 import re
-from typing import List, Dict, Tuple, Optional
+import threading
+import time
+from typing import List, Dict, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
+# Hot-path patterns compiled once at import; the stop-word set is a
+# frozenset so per-call membership tests skip rebuilding it
+_URL_TRANS = str.maketrans({'-': ' ', '_': ' ', '@': ' ', '.': ' ', '/': ' ', ':': ' '})
+_WORD_RE = re.compile(r'\b[a-z]{3,}\b')
+_TITLE_RE = re.compile(r'TITLE:\s*(.+)')
+_BODY_RE = re.compile(r'BODY:\s*(.+)', re.DOTALL)
+_STOP_WORDS = frozenset({
+    'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'her',
+    'was', 'one', 'our', 'had', 'article', 'post', 'blog', 'medium',
+    'https', 'http', 'www', 'com', 'org'
+})
+
+# Trigger word -> topic for the fallback recommendations; one compiled
+# scan over the content replaces three independent any(... in ...) passes
+_TRIGGER_TOPICS = {
+    'python': 'python', 'programming': 'python', 'code': 'python', 'developer': 'python',
+    'web': 'web', 'javascript': 'web', 'react': 'web', 'frontend': 'web',
+    'data': 'data', 'science': 'data', 'machine learning': 'data', 'ai': 'data',
+}
+_TRIGGER_RE = re.compile('|'.join(sorted(_TRIGGER_TOPICS, key=len, reverse=True)))
+
+# word -> topic bucket for the fallback analysis; one dict probe per
+# keyword replaces three list-membership passes
+_TOPIC_MAP = {}
+_TOPIC_MAP.update(dict.fromkeys(
+    ('python', 'javascript', 'programming', 'code', 'development', 'software', 'tech'), 'tech'))
+_TOPIC_MAP.update(dict.fromkeys(
+    ('business', 'startup', 'entrepreneur', 'marketing', 'sales', 'growth'), 'business'))
+_TOPIC_MAP.update(dict.fromkeys(
+    ('data', 'science', 'machine', 'learning', 'ai', 'analytics', 'statistics'), 'data'))
+
 try:
-    from groq import Groq
+    from groq import Groq, AsyncGroq
     GROQ_AVAILABLE = True
 except ImportError:
     GROQ_AVAILABLE = False
+    Groq = None
+    AsyncGroq = None
+
+# Module-level Groq clients shared by every recommender instance, so a
+# per-request construction doesn't rebuild the HTTP client (and re-pay
+# its TLS handshake) each time
+_GROQ_CLIENTS = None
+_GROQ_CLIENTS_LOCK = threading.Lock()
+
+def _get_groq_clients():
+    """Build the shared (sync, async) Groq client pair once"""
+    global _GROQ_CLIENTS
+    if _GROQ_CLIENTS is None:
+        with _GROQ_CLIENTS_LOCK:
+            if _GROQ_CLIENTS is None:
+                api_key = os.getenv("GROQ_API_KEY")
+                if GROQ_AVAILABLE and api_key:
+                    try:
+                        _GROQ_CLIENTS = (Groq(api_key=api_key), AsyncGroq(api_key=api_key))
+                    except:
+                        _GROQ_CLIENTS = (None, None)
+                else:
+                    _GROQ_CLIENTS = (None, None)
+    return _GROQ_CLIENTS
 
 @dataclass
 class SubredditRecommendation:
@@ -28,13 +90,24 @@ class SubredditRecommendation:
     content_guidelines: str = ""
 
 class EnhancedSubredditRecommender:
+    # Cap on in-flight Groq requests during batched analysis
+    MAX_CONCURRENT_AI_CALLS = 8
+
+    # Small/fast model for the JSON classification leg; the 70B model is
+    # reserved for post generation where quality actually shows
+    _ANALYSIS_MODEL = "llama-3.1-8b-instant"
+    _GENERATION_MODEL = "llama-3.3-70b-versatile"
+
+    # Analyses for the same URL within this window come from memory
+    # instead of a fresh Groq round trip
+    ANALYSIS_TTL = 3600
+
     def __init__(self):
-        self.groq_client = None
-        if GROQ_AVAILABLE and os.getenv("GROQ_API_KEY"):
-            try:
-                self.groq_client = Groq(api_key=os.getenv("GROQ_API_KEY"))
-            except:
-                pass
+        self._analysis_cache = {}
+        self._analysis_lock = threading.Lock()
+        # Both clients come from the shared module singletons; AsyncGroq
+        # keeps one pooled HTTP client across the batched calls below
+        self.groq_client, self.async_groq_client = _get_groq_clients()
         
         # Enhanced subreddit database with detailed rules
         self.subreddit_database = {
@@ -129,37 +202,60 @@ class EnhancedSubredditRecommender:
                 "posting_guidelines": "Technical data science content with examples"
             }
         }
+
+        # Derived fields the scorers consult on every call, computed once:
+        # lowered focus terms plus the rule/guideline membership flags
+        for subreddit_data in self.subreddit_database.values():
+            subreddit_data['focus_lower'] = tuple(term.lower() for term in subreddit_data['focus'])
+            rules_lower = ' '.join(subreddit_data.get('rules', [])).lower()
+            subreddit_data['no_promo_rule'] = 'no self-promotion' in rules_lower
+            subreddit_data['code_rule'] = 'code' in rules_lower
+            subreddit_data['educational_guidelines'] = 'educational' in subreddit_data.get('posting_guidelines', '')
+            subreddit_data['research_content'] = 'research' in subreddit_data.get('content_type', '')
     
     def analyze_article_content(self, article_url: str) -> Dict:
         """Analyze article content to understand topics and themes"""
+        with self._analysis_lock:
+            entry = self._analysis_cache.get(article_url)
+            if entry is not None and time.time() - entry[0] < self.ANALYSIS_TTL:
+                # Copy so a caller mutating the result can't poison the cache
+                return dict(entry[1])
+
         # Extract basic info from URL
         url_keywords = self._extract_keywords_from_url(article_url)
         
+        analysis = None
         if self.groq_client:
             try:
                 # Use AI to analyze content
-                return self._ai_analyze_content(article_url, url_keywords)
+                analysis = self._ai_analyze_content(article_url, url_keywords)
             except:
                 pass
         
-        # Fallback analysis
-        return self._fallback_content_analysis(url_keywords)
+        if analysis is None:
+            # Fallback analysis
+            analysis = self._fallback_content_analysis(url_keywords)
+
+        with self._analysis_lock:
+            self._analysis_cache[article_url] = (time.time(), analysis)
+        return dict(analysis)
     
-    def _extract_keywords_from_url(self, url: str) -> List[str]:
-        """Extract keywords from URL"""
-        # Remove common URL parts and extract meaningful words
-        cleaned = re.sub(r'https?://|www\.|\.com|\.org|/@|\-|_', ' ', url.lower())
-        words = re.findall(r'\b[a-z]{3,}\b', cleaned)
+    @functools.lru_cache(maxsize=4096)
+    def _extract_keywords_from_url(self, url: str) -> tuple:
+        """Extract keywords from URL (tuple so the result is cacheable)"""
+        # Break the URL on separator characters in one translate pass;
+        # scheme/host fragments (https, www, com, ...) fall out below as
+        # short tokens or stop words
+        cleaned = url.lower().translate(_URL_TRANS)
+        words = _WORD_RE.findall(cleaned)
         
         # Filter out common words
-        stop_words = {'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'her', 'was', 'one', 'our', 'had', 'but', 'article', 'post', 'blog', 'medium'}
-        keywords = [word for word in words if word not in stop_words]
+        keywords = tuple(word for word in words if word not in _STOP_WORDS)
         
         return keywords[:10]  # Return top 10 keywords
     
-    def _ai_analyze_content(self, article_url: str, url_keywords: List[str]) -> Dict:
-        """Use AI to analyze article content"""
-        prompt = f"""
+    def _build_analysis_prompt(self, article_url: str, url_keywords: List[str]) -> str:
+        return f"""
         Analyze this article URL and keywords to determine the main topics and themes:
         
         URL: {article_url}
@@ -182,30 +278,73 @@ class EnhancedSubredditRecommender:
             "keywords": ["keyword1", "keyword2", "keyword3"]
         }}
         """
-        
+
+    def _ai_analyze_content(self, article_url: str, url_keywords: List[str]) -> Dict:
+        """Use AI to analyze article content"""
+        # JSON mode makes Groq emit valid JSON, so the response parses
+        # directly; transport errors propagate to the caller's fallback
         response = self.groq_client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=500,
-            temperature=0.3
+            model=self._ANALYSIS_MODEL,
+            messages=[{"role": "user", "content": self._build_analysis_prompt(article_url, url_keywords)}],
+            max_tokens=256,
+            temperature=0.1,
+            response_format={"type": "json_object"}
         )
         
+        return json.loads(response.choices[0].message.content)
+
+    async def _ai_analyze_content_async(self, article_url: str, semaphore: "asyncio.Semaphore") -> Dict:
+        """Async twin of analyze_article_content for one URL"""
+        url_keywords = self._extract_keywords_from_url(article_url)
+        if self.async_groq_client is None:
+            return self._fallback_content_analysis(url_keywords)
+
         try:
-            import json
+            async with semaphore:
+                response = await self.async_groq_client.chat.completions.create(
+                    model=self._ANALYSIS_MODEL,
+                    messages=[{"role": "user", "content": self._build_analysis_prompt(article_url, url_keywords)}],
+                    max_tokens=256,
+                    temperature=0.1,
+                    response_format={"type": "json_object"}
+                )
             return json.loads(response.choices[0].message.content)
         except:
             return self._fallback_content_analysis(url_keywords)
+
+    async def _analyze_articles_async(self, article_urls: List[str]) -> List[Dict]:
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_AI_CALLS)
+        return list(await asyncio.gather(
+            *(self._ai_analyze_content_async(url, semaphore) for url in article_urls)
+        ))
+
+    def analyze_articles_batch(self, article_urls: List[str]) -> List[Dict]:
+        """Analyze several article URLs with concurrent Groq calls.
+
+        The requests overlap on the wire, so N analyses cost roughly one
+        round trip instead of N sequential ones.
+        """
+        return asyncio.run(self._analyze_articles_async(article_urls))
+
+    def recommend_subreddits_batch(self, article_urls: List[str], max_recommendations: int = 6) -> List[List[SubredditRecommendation]]:
+        """Batched recommend_subreddits over many URLs, one result list per URL"""
+        analyses = self.analyze_articles_batch(article_urls)
+        return [
+            self._recommendations_from_analysis(analysis, max_recommendations)
+            for analysis in analyses
+        ]
     
     def _fallback_content_analysis(self, keywords: List[str]) -> Dict:
         """Fallback content analysis based on keywords"""
-        # Determine primary topic based on keywords
-        tech_words = ['python', 'javascript', 'programming', 'code', 'development', 'software', 'tech']
-        business_words = ['business', 'startup', 'entrepreneur', 'marketing', 'sales', 'growth']
-        data_words = ['data', 'science', 'machine', 'learning', 'ai', 'analytics', 'statistics']
-        
-        tech_score = sum(1 for word in keywords if word in tech_words)
-        business_score = sum(1 for word in keywords if word in business_words)
-        data_score = sum(1 for word in keywords if word in data_words)
+        # Determine primary topic with a single pass over the keywords
+        scores = {'tech': 0, 'business': 0, 'data': 0}
+        for word in keywords:
+            topic = _TOPIC_MAP.get(word)
+            if topic:
+                scores[topic] += 1
+        tech_score = scores['tech']
+        business_score = scores['business']
+        data_score = scores['data']
         
         if tech_score >= business_score and tech_score >= data_score:
             primary_topic = "programming"
@@ -253,24 +392,25 @@ class EnhancedSubredditRecommender:
     
     def _get_fallback_recommendations(self, content: str, num_recommendations: int) -> List[Dict]:
         """Fallback recommendations when AI is not available"""
-        content_lower = content.lower()
+        # Single pass over the content collecting every matched topic
+        topics = {_TRIGGER_TOPICS[match] for match in _TRIGGER_RE.findall(content.casefold())}
         fallback_recs = []
         
         # Simple keyword-based matching
-        if any(word in content_lower for word in ["python", "programming", "code", "developer"]):
+        if 'python' in topics:
             fallback_recs.extend([
                 {"name": "learnpython", "score": 0.8, "reason": "Python programming content", "risk_level": "low", "subscribers": 900000},
                 {"name": "Python", "score": 0.9, "reason": "Python-specific content", "risk_level": "low", "subscribers": 800000},
                 {"name": "programming", "score": 0.7, "reason": "General programming content", "risk_level": "medium", "subscribers": 4000000}
             ])
         
-        if any(word in content_lower for word in ["web", "javascript", "react", "frontend"]):
+        if 'web' in topics:
             fallback_recs.extend([
                 {"name": "webdev", "score": 0.8, "reason": "Web development content", "risk_level": "low", "subscribers": 700000},
                 {"name": "javascript", "score": 0.9, "reason": "JavaScript content", "risk_level": "medium", "subscribers": 500000}
             ])
         
-        if any(word in content_lower for word in ["data", "science", "machine learning", "ai"]):
+        if 'data' in topics:
             fallback_recs.extend([
                 {"name": "MachineLearning", "score": 0.9, "reason": "AI/ML content", "risk_level": "low", "subscribers": 600000},
                 {"name": "datascience", "score": 0.8, "reason": "Data science content", "risk_level": "low", "subscribers": 400000}
@@ -285,52 +425,107 @@ class EnhancedSubredditRecommender:
         
         return fallback_recs[:num_recommendations]
     
+    # Shared pool for the CPU-bound fallback batch path; sized modestly
+    # since the work is string scanning, not I/O
+    _FALLBACK_POOL = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4))
+
+    def prefetch_urls(self, urls: List[str]) -> None:
+        """Warm the analysis cache for URLs the caller will need soon.
+
+        Fire-and-forget: each analysis runs on the shared pool and lands
+        in the TTL cache, so the later interactive recommend_subreddits
+        call hits memory instead of waiting on Groq.
+        """
+        for url in urls:
+            self._FALLBACK_POOL.submit(self.analyze_article_content, url)
+
+    def recommend_subreddits_batch_fallback(self, contents: List[str], num_recommendations: int = 5) -> List[List[Dict]]:
+        """Run the non-AI fallback recommendations for many articles in parallel"""
+        return list(self._FALLBACK_POOL.map(
+            lambda content: self._get_fallback_recommendations(content, num_recommendations),
+            contents
+        ))
+
     def recommend_subreddits(self, article_url: str, max_recommendations: int = 6) -> List[SubredditRecommendation]:
         """Original method for detailed recommendations"""
         content_analysis = self.analyze_article_content(article_url)
-        recommendations = []
-        
+        return self._recommendations_from_analysis(content_analysis, max_recommendations)
+
+    def _recommendations_from_analysis(self, content_analysis: Dict, max_recommendations: int) -> List[SubredditRecommendation]:
+        """Score every known subreddit against an existing content analysis"""
+        # Score everything as bare floats first; recommendation objects
+        # (reason strings, rule copies, ...) are only built for the
+        # entries that survive the threshold and the top-K cut
+        # Merge and lowercase the content keywords once for the whole
+        # scoring pass instead of per subreddit
+        keywords_lower = [
+            keyword.lower()
+            for keyword in tuple(content_analysis.get('keywords', ())) + tuple(content_analysis.get('themes', ()))
+        ]
+
+        scored = []
         for subreddit_name, subreddit_data in self.subreddit_database.items():
-            relevance_score = self._calculate_relevance_score(content_analysis, subreddit_data)
+            relevance_score = self._calculate_relevance_score(content_analysis, subreddit_data, keywords_lower)
             compliance_score = self._calculate_compliance_score(content_analysis, subreddit_data)
             overall_score = (relevance_score * 0.7) + (compliance_score * 0.3)
-            
-            recommendation = SubredditRecommendation(
+            if overall_score > 0.3:  # Only include relevant subreddits
+                scored.append((overall_score, relevance_score, compliance_score, subreddit_name))
+        
+        # Top-K selection is O(N log K) vs a full O(N log N) sort, which
+        # matters if the database grows past a handful of entries
+        top = heapq.nlargest(max_recommendations, scored)
+        
+        return [
+            SubredditRecommendation(
                 name=subreddit_name,
                 relevance_score=relevance_score,
                 compliance_score=compliance_score,
                 overall_score=overall_score,
                 why_recommended=self._generate_recommendation_reason(subreddit_name, content_analysis, relevance_score),
-                risk_level=self._assess_risk_level(subreddit_data, compliance_score),
-                subscribers=subreddit_data.get('subscribers', 100000),
-                posting_rules=subreddit_data.get('rules', []),
-                required_flair=subreddit_data.get('required_flair', ''),
-                title_requirements=subreddit_data.get('title_format', ''),
-                content_guidelines=subreddit_data.get('posting_guidelines', '')
+                risk_level=self._assess_risk_level(self.subreddit_database[subreddit_name], compliance_score),
+                subscribers=self.subreddit_database[subreddit_name].get('subscribers', 100000),
+                posting_rules=self.subreddit_database[subreddit_name].get('rules', []),
+                required_flair=self.subreddit_database[subreddit_name].get('required_flair', ''),
+                title_requirements=self.subreddit_database[subreddit_name].get('title_format', ''),
+                content_guidelines=self.subreddit_database[subreddit_name].get('posting_guidelines', '')
             )
-            
-            if overall_score > 0.3:  # Only include relevant subreddits
-                recommendations.append(recommendation)
-        
-        # Sort by overall score
-        recommendations.sort(key=lambda x: x.overall_score, reverse=True)
-        return recommendations[:max_recommendations]
+            for overall_score, relevance_score, compliance_score, subreddit_name in top
+        ]
     
-    def _calculate_relevance_score(self, content_analysis: Dict, subreddit_data: Dict) -> float:
+    # The scorers stay pure Python on purpose: after the precompute
+    # passes they are a few dozen string/hash ops over a six-entry
+    # database, far below the threshold where a Numba/Cython kernel
+    # (and the int-interning it needs) would pay for its warmup and
+    # build complexity. Revisit if the database grows by orders of
+    # magnitude.
+    def _calculate_relevance_score(self, content_analysis: Dict, subreddit_data: Dict, keywords_lower: List[str] = None) -> float:
         """Calculate how relevant the content is to the subreddit"""
         score = 0.0
-        content_keywords = content_analysis.get('keywords', []) + content_analysis.get('themes', [])
-        subreddit_focus = subreddit_data.get('focus', [])
-        
-        # Check keyword overlap
-        for keyword in content_keywords:
-            for focus_area in subreddit_focus:
-                if keyword.lower() in focus_area.lower() or focus_area.lower() in keyword.lower():
+        if keywords_lower is None:
+            # Lowercase each keyword once; the nested scan then runs over
+            # precomputed strings instead of allocating per pair
+            keywords_lower = [
+                keyword.lower()
+                for keyword in tuple(content_analysis.get('keywords', ())) + tuple(content_analysis.get('themes', ()))
+            ]
+        focus_lower = subreddit_data.get('focus_lower')
+        if focus_lower is None:
+            focus_lower = tuple(term.lower() for term in subreddit_data.get('focus', []))
+
+        # Check keyword overlap - exact hits resolve via the set before
+        # falling back to the substring comparison
+        focus_set = frozenset(focus_lower)
+        for keyword in keywords_lower:
+            if keyword in focus_set:
+                score += 0.2
+                continue
+            for focus_area in focus_lower:
+                if keyword in focus_area or focus_area in keyword:
                     score += 0.2
         
         # Topic alignment
         primary_topic = content_analysis.get('primary_topic', '')
-        if primary_topic in subreddit_focus:
+        if primary_topic in subreddit_data.get('focus', []):
             score += 0.4
         
         return min(score, 1.0)
@@ -340,15 +535,25 @@ class EnhancedSubredditRecommender:
         # Base compliance score
         score = 0.7
         
-        # Check if content type matches subreddit expectations
+        # Check if content type matches subreddit expectations; the
+        # precomputed flags are O(1) reads, with the substring check kept
+        # only for ad-hoc dicts that lack them
         content_type = content_analysis.get('content_type', '')
-        if content_type == 'tutorial' and 'educational' in subreddit_data.get('posting_guidelines', ''):
-            score += 0.2
+        if content_type == 'tutorial':
+            educational = subreddit_data.get('educational_guidelines')
+            if educational is None:
+                educational = 'educational' in subreddit_data.get('posting_guidelines', '')
+            if educational:
+                score += 0.2
         
         # Technical level appropriateness
         tech_level = content_analysis.get('technical_level', '')
-        if tech_level in ['intermediate', 'advanced'] and 'research' in subreddit_data.get('content_type', ''):
-            score += 0.1
+        if tech_level in ('intermediate', 'advanced'):
+            research = subreddit_data.get('research_content')
+            if research is None:
+                research = 'research' in subreddit_data.get('content_type', '')
+            if research:
+                score += 0.1
         
         return min(score, 1.0)
     
@@ -388,8 +593,46 @@ class EnhancedSubredditRecommender:
         # Fallback generation
         return self._fallback_post_generation(article_url, subreddit_name, subreddit_data)
     
-    def _ai_generate_compliant_post(self, article_url: str, subreddit_name: str, subreddit_data: Dict, content_analysis: Dict) -> Dict:
-        """Use AI to generate policy-compliant post"""
+    async def generate_policy_compliant_post_async(self, article_url: str, subreddit_name: str, content_analysis: Dict = None) -> Dict:
+        """Async twin of generate_policy_compliant_post.
+
+        Awaiting the Groq call lets callers generate posts for several
+        subreddits concurrently; see generate_compliant_posts_batch.
+        """
+        if not content_analysis:
+            content_analysis = self.analyze_article_content(article_url)
+
+        subreddit_data = self.subreddit_database.get(subreddit_name, {})
+
+        if self.async_groq_client:
+            try:
+                response = await self.async_groq_client.chat.completions.create(
+                    model=self._GENERATION_MODEL,
+                    messages=[{"role": "user", "content": self._build_post_prompt(article_url, subreddit_name, subreddit_data, content_analysis)}],
+                    max_tokens=1000,
+                    temperature=0.7
+                )
+                title, body = self._parse_ai_response(response.choices[0].message.content)
+                return self._compliant_post_result(title, body, subreddit_name, subreddit_data)
+            except:
+                pass
+
+        return self._fallback_post_generation(article_url, subreddit_name, subreddit_data)
+
+    def generate_compliant_posts_batch(self, article_url: str, subreddit_names: List[str], content_analysis: Dict = None) -> List[Dict]:
+        """Generate posts for several subreddits with overlapped Groq calls"""
+        if not content_analysis:
+            content_analysis = self.analyze_article_content(article_url)
+
+        async def _run():
+            return list(await asyncio.gather(*(
+                self.generate_policy_compliant_post_async(article_url, name, content_analysis)
+                for name in subreddit_names
+            )))
+
+        return asyncio.run(_run())
+
+    def _build_post_prompt(self, article_url: str, subreddit_name: str, subreddit_data: Dict, content_analysis: Dict) -> str:
         rules = "\n".join(subreddit_data.get('rules', []))
         guidelines = subreddit_data.get('posting_guidelines', '')
         title_format = subreddit_data.get('title_format', '')
@@ -424,17 +667,8 @@ class EnhancedSubredditRecommender:
         
         Make it feel natural and community-focused.
         """
-        
-        response = self.groq_client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=1000,
-            temperature=0.7
-        )
-        
-        result_text = response.choices[0].message.content
-        title, body = self._parse_ai_response(result_text)
-        
+
+    def _compliant_post_result(self, title: str, body: str, subreddit_name: str, subreddit_data: Dict) -> Dict:
         return {
             "title": title,
             "body": body,
@@ -443,12 +677,25 @@ class EnhancedSubredditRecommender:
             "required_flair": subreddit_data.get('required_flair', ''),
             "posting_tips": self._generate_posting_tips(subreddit_name)
         }
+
+    def _ai_generate_compliant_post(self, article_url: str, subreddit_name: str, subreddit_data: Dict, content_analysis: Dict) -> Dict:
+        """Use AI to generate policy-compliant post"""
+        response = self.groq_client.chat.completions.create(
+            model=self._GENERATION_MODEL,
+            messages=[{"role": "user", "content": self._build_post_prompt(article_url, subreddit_name, subreddit_data, content_analysis)}],
+            max_tokens=1000,
+            temperature=0.7
+        )
+        
+        result_text = response.choices[0].message.content
+        title, body = self._parse_ai_response(result_text)
+        
+        return self._compliant_post_result(title, body, subreddit_name, subreddit_data)
     
     def _parse_ai_response(self, text: str) -> Tuple[str, str]:
         """Parse AI response to extract title and body"""
-        import re
-        title_match = re.search(r'TITLE:\s*(.+)', text)
-        body_match = re.search(r'BODY:\s*(.+)', text, re.DOTALL)
+        title_match = _TITLE_RE.search(text)
+        body_match = _BODY_RE.search(text)
         
         title = title_match.group(1).strip() if title_match else "Interesting Article Discussion"
         body = body_match.group(1).strip() if body_match else text
@@ -486,10 +733,18 @@ Looking forward to hearing different perspectives!"""
         if subreddit_data.get('required_flair'):
             notes.append(f"⚠️ Required flair: {subreddit_data['required_flair']}")
         
-        if 'no self-promotion' in str(subreddit_data.get('rules', [])).lower():
+        no_promo = subreddit_data.get('no_promo_rule')
+        code_rule = subreddit_data.get('code_rule')
+        if no_promo is None or code_rule is None:
+            # Unknown subreddit dict without the precomputed flags
+            rules_lower = ' '.join(subreddit_data.get('rules', [])).lower()
+            no_promo = 'no self-promotion' in rules_lower
+            code_rule = 'code' in rules_lower
+
+        if no_promo:
             notes.append("📝 Focus on discussion value, not promotion")
         
-        if 'code' in str(subreddit_data.get('rules', [])).lower():
+        if code_rule:
             notes.append("💻 Include code examples if relevant")
         
         return notes
@@ -509,12 +764,8 @@ Looking forward to hearing different perspectives!"""
         
         return tips
     
-    def generate_post(self, content: str, subreddit: str) -> Dict:
-        """Generate a post for specific subreddit (compatible interface)"""
-        try:
-            if self.groq_client:
-                # Use AI to generate post
-                prompt = f"""
+    def _build_generate_prompt(self, content: str, subreddit: str) -> str:
+        return f"""
 Create a Reddit post for r/{subreddit} based on this content:
 
 {content}
@@ -530,6 +781,58 @@ Format your response as:
 TITLE: [your title here]
 CONTENT: [your post content here]
 """
+
+    def generate_post_stream(self, content: str, subreddit: str):
+        """Stream a generated post instead of waiting for the whole reply.
+
+        Yields {"title": ...} as soon as the CONTENT: marker arrives,
+        then the body text in deltas as Groq produces them - callers see
+        first tokens at first-token latency rather than full-generation
+        latency.
+        """
+        if not self.groq_client:
+            post = self._generate_fallback_post(content, subreddit)
+            yield {"title": post["title"]}
+            yield post["content"]
+            return
+
+        response = self.groq_client.chat.completions.create(
+            model=self._GENERATION_MODEL,
+            messages=[{"role": "user", "content": self._build_generate_prompt(content, subreddit)}],
+            max_tokens=1000,
+            temperature=0.7,
+            stream=True
+        )
+
+        buffer = ""
+        title_sent = False
+        for chunk in response:
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            if title_sent:
+                yield delta
+                continue
+            buffer += delta
+            if "CONTENT:" in buffer:
+                head, _, rest = buffer.partition("CONTENT:")
+                title = head.partition("TITLE:")[2].strip()
+                yield {"title": title or "Interesting Article Discussion"}
+                title_sent = True
+                if rest.strip():
+                    yield rest.lstrip()
+
+        if not title_sent:
+            # No CONTENT: marker arrived; fall back to the buffered text
+            yield {"title": "Interesting Article Discussion"}
+            yield buffer
+
+    def generate_post(self, content: str, subreddit: str) -> Dict:
+        """Generate a post for specific subreddit (compatible interface)"""
+        try:
+            if self.groq_client:
+                # Use AI to generate post
+                prompt = self._build_generate_prompt(content, subreddit)
                 
                 try:
                     response = self.groq_client.chat.completions.create(
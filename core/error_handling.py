@@ -2,18 +2,50 @@
 Enhanced Error Handling and Logging for Reddit Automation Toolkit
 Provides structured error handling, logging, and user-friendly error messages
 """
+import atexit
 import logging
+import logging.handlers
+import queue
+import re
 import sys
 import traceback
-import json
 from enum import Enum
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
+import bisect
+import time
+from collections import Counter, deque
+from itertools import islice
 from datetime import datetime, timedelta
 from pathlib import Path
+from types import MappingProxyType
+import json
+
+# orjson's C serializer beats stdlib json on the small context dicts
+# _log_error emits; fall back silently when it isn't installed
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, default=str).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, default=str)
 
-class ErrorCode(Enum):
-    """Structured error codes for different types of failures"""
+# Optional structured log output: when python-json-logger is installed
+# the file handler emits one machine-parseable JSON object per record
+# instead of text plus an escaped JSON blob ingestion has to re-parse
+try:
+    from pythonjsonlogger.jsonlogger import JsonFormatter
+except ImportError:
+    JsonFormatter = None
+
+class ErrorCode(str, Enum):
+    """Structured error codes for different types of failures
+
+    str-backed so comparisons, hashing and table lookups use CPython's
+    C-level string ops, and serializers emit members without a hook.
+    """
     # Configuration Errors
     CONFIG_ERROR = "CONFIG_ERROR"
     MISSING_ENV_VARS = "MISSING_ENV_VARS"
@@ -52,7 +84,7 @@ class ErrorCode(Enum):
     WORKFLOW_ERROR = "WORKFLOW_ERROR"
     STEP_FAILED = "STEP_FAILED"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ErrorDetails:
     """Detailed error information"""
     code: ErrorCode
@@ -62,11 +94,65 @@ class ErrorDetails:
     suggestions: Optional[List[str]] = None
     help_url: Optional[str] = None
     retry_after: Optional[int] = None
-    timestamp: Optional[datetime] = None
+    # Raw nanosecond clock reading; datetime construction is deferred to
+    # the timestamp property so the raise path stays allocation-light
+    ts_ns: Optional[int] = None
+
+
+# Lookup tables for RedditAutomationError, built once at import time
+# instead of on every raise; MappingProxyType keeps them read-only
+_USER_MESSAGES = MappingProxyType({
+    ErrorCode.MISSING_ENV_VARS: "Your Reddit automation system isn't configured yet. Please run the setup wizard to get started.",
+    ErrorCode.REDDIT_AUTH_FAILED: "Could not connect to Reddit. Please check your Reddit API credentials.",
+    ErrorCode.AI_API_ERROR: "The AI service is currently unavailable. Please try again in a few minutes.",
+    ErrorCode.RATE_LIMIT: "You're making requests too quickly. Please wait a moment before trying again.",
+    ErrorCode.SUBREDDIT_NOT_FOUND: "The subreddit you specified doesn't exist or is private.",
+    ErrorCode.POSTING_DENIED: "You don't have permission to post in this subreddit.",
+    ErrorCode.CONTENT_VIOLATION: "Your content may violate subreddit rules. Please review and modify.",
+    ErrorCode.URL_INVALID: "The article URL you provided is not valid or accessible.",
+    ErrorCode.SPAM_DETECTED: "Your content appears promotional. Consider making it more informative.",
+})
+
+_SUGGESTIONS = MappingProxyType({
+    ErrorCode.MISSING_ENV_VARS: (
+        "Run: python scripts/setup_environment.py",
+        "Check the README.md for setup instructions",
+        "Ensure all required API keys are obtained"
+    ),
+    ErrorCode.REDDIT_AUTH_FAILED: (
+        "Verify your Reddit username and password",
+        "Check that your Reddit app credentials are correct",
+        "Ensure you created a 'script' type app, not 'web app'"
+    ),
+    ErrorCode.AI_API_ERROR: (
+        "Check your Groq API key is valid",
+        "Verify you have API credits remaining",
+        "Try again in a few minutes"
+    ),
+    ErrorCode.POSTING_DENIED: (
+        "Check if you meet the subreddit's karma requirements",
+        "Verify your account age meets requirements",
+        "Make sure you're not banned from the subreddit"
+    ),
+    ErrorCode.CONTENT_VIOLATION: (
+        "Review the subreddit's posting rules",
+        "Make your content less promotional",
+        "Add more educational value to your post"
+    ),
+})
+_DEFAULT_SUGGESTIONS = ("Check the logs for more details",)
+
+_HELP_URLS = MappingProxyType({
+    ErrorCode.MISSING_ENV_VARS: "https://github.com/your-repo/setup-guide",
+    ErrorCode.REDDIT_AUTH_FAILED: "https://www.reddit.com/prefs/apps",
+    ErrorCode.AI_API_ERROR: "https://console.groq.com/keys",
+})
 
 class RedditAutomationError(Exception):
     """Base exception class for Reddit automation errors"""
     
+    __slots__ = ('_details', '_dict_cache')
+    
     def __init__(self, 
                  code: ErrorCode, 
                  message: str, 
@@ -76,115 +162,235 @@ class RedditAutomationError(Exception):
                  help_url: Optional[str] = None,
                  retry_after: Optional[int] = None):
         
-        # Store individual attributes for backward compatibility
-        self.code = code
-        self.message = message
-        self.user_message = user_message or self._generate_user_message(code, message)
-        self.details = details or {}
-        self.suggestions = suggestions or self._generate_suggestions(code)
-        self.help_url = help_url or self._get_help_url(code)
-        self.retry_after = retry_after
-        self.timestamp = datetime.now()
-        
-        # Also store as ErrorDetails object for compatibility
-        self.error_details = ErrorDetails(
+        # Single ErrorDetails instance; the flat attributes callers use
+        # (self.code, self.message, ...) are property views onto it
+        self._details = ErrorDetails(
             code=code,
             message=message,
-            user_message=self.user_message,
-            details=self.details,
-            suggestions=self.suggestions,
-            help_url=self.help_url,
+            user_message=user_message or self._generate_user_message(code, message),
+            details=details or {},
+            suggestions=suggestions or self._generate_suggestions(code, retry_after),
+            help_url=help_url or self._get_help_url(code),
             retry_after=retry_after,
-            timestamp=self.timestamp
+            ts_ns=time.time_ns()
         )
         
+        self._dict_cache = None
         super().__init__(message)
     
+    @property
+    def code(self) -> ErrorCode:
+        return self._details.code
+    
+    @property
+    def message(self) -> str:
+        return self._details.message
+    
+    @property
+    def user_message(self) -> Optional[str]:
+        return self._details.user_message
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        return self._details.details
+    
+    @property
+    def suggestions(self) -> List[str]:
+        return self._details.suggestions
+    
+    @property
+    def help_url(self) -> Optional[str]:
+        return self._details.help_url
+    
+    @property
+    def retry_after(self) -> Optional[int]:
+        return self._details.retry_after
+    
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self._details.ts_ns / 1e9)
+    
+    @property
+    def error_details(self) -> ErrorDetails:
+        return self._details
+    
+
     def _generate_user_message(self, code: ErrorCode, message: str) -> str:
         """Generate user-friendly error message"""
-        user_messages = {
-            ErrorCode.MISSING_ENV_VARS: "Your Reddit automation system isn't configured yet. Please run the setup wizard to get started.",
-            ErrorCode.REDDIT_AUTH_FAILED: "Could not connect to Reddit. Please check your Reddit API credentials.",
-            ErrorCode.AI_API_ERROR: "The AI service is currently unavailable. Please try again in a few minutes.",
-            ErrorCode.RATE_LIMIT: "You're making requests too quickly. Please wait a moment before trying again.",
-            ErrorCode.SUBREDDIT_NOT_FOUND: "The subreddit you specified doesn't exist or is private.",
-            ErrorCode.POSTING_DENIED: "You don't have permission to post in this subreddit.",
-            ErrorCode.CONTENT_VIOLATION: "Your content may violate subreddit rules. Please review and modify.",
-            ErrorCode.URL_INVALID: "The article URL you provided is not valid or accessible.",
-            ErrorCode.SPAM_DETECTED: "Your content appears promotional. Consider making it more informative.",
-        }
-        return user_messages.get(code, f"An error occurred: {message}")
+        return _USER_MESSAGES.get(code, f"An error occurred: {message}")
     
-    def _generate_suggestions(self, code: ErrorCode) -> List[str]:
+    def _generate_suggestions(self, code: ErrorCode, retry_after: Optional[int] = None) -> List[str]:
         """Generate helpful suggestions based on error code"""
-        suggestions = {
-            ErrorCode.MISSING_ENV_VARS: [
-                "Run: python scripts/setup_environment.py",
-                "Check the README.md for setup instructions",
-                "Ensure all required API keys are obtained"
-            ],
-            ErrorCode.REDDIT_AUTH_FAILED: [
-                "Verify your Reddit username and password",
-                "Check that your Reddit app credentials are correct",
-                "Ensure you created a 'script' type app, not 'web app'"
-            ],
-            ErrorCode.AI_API_ERROR: [
-                "Check your Groq API key is valid",
-                "Verify you have API credits remaining",
-                "Try again in a few minutes"
+        if code is ErrorCode.RATE_LIMIT:
+            # Interpolates the actual retry window, so built per error
+            return [
+                f"Wait {retry_after or 60} seconds before retrying",
+                "Consider reducing the frequency of requests",
+                "Use the built-in rate limiting features"
             ]
-        }
-        return suggestions.get(code, ["Check the logs for more details"])
+        # Fresh list so callers can append without touching the table
+        return list(_SUGGESTIONS.get(code, _DEFAULT_SUGGESTIONS))
     
     def _get_help_url(self, code: ErrorCode) -> Optional[str]:
         """Get help URL for specific error types"""
-        help_urls = {
-            ErrorCode.MISSING_ENV_VARS: "https://github.com/your-repo/setup-guide",
-            ErrorCode.REDDIT_AUTH_FAILED: "https://www.reddit.com/prefs/apps",
-            ErrorCode.AI_API_ERROR: "https://console.groq.com/keys",
-        }
-        return help_urls.get(code)
+        return _HELP_URLS.get(code)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert error to dictionary for JSON serialization"""
-        return {
-            "error_code": self.code.value,
-            "message": self.message,
-            "user_message": self.user_message,
-            "details": self.details,
-            "suggestions": self.suggestions,
-            "help_url": self.help_url,
-            "retry_after": self.retry_after,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None
-        }
+        # Built once; the same error re-handled (rate-limit retry loops)
+        # reuses the payload instead of re-serializing the timestamp
+        cached = self._dict_cache
+        if cached is None:
+            cached = self._dict_cache = {
+                "error_code": self.code,
+                "message": self.message,
+                "user_message": self.user_message,
+                "details": self.details,
+                "suggestions": self.suggestions,
+                "help_url": self.help_url,
+                "retry_after": self.retry_after,
+                "timestamp": self.timestamp.isoformat()
+            }
+        return cached
+
+# Dispatch tables for _convert_to_structured_error: one dict probe on
+# the HTTP status and one compiled scan over the message replace the
+# if/elif cascade of Python-level substring tests
+_STATUS_MAP = {
+    401: lambda error, status_code: RedditAutomationError(
+        ErrorCode.REDDIT_AUTH_FAILED,
+        "Reddit authentication failed",
+        details={"status_code": status_code, "original_error": str(error)}
+    ),
+    429: lambda error, status_code: RedditAutomationError(
+        ErrorCode.RATE_LIMIT,
+        "Rate limit exceeded",
+        retry_after=300,
+        details={"status_code": status_code}
+    ),
+}
+
+# PRAW-flavoured branches only apply when the exception type says so,
+# hence the two alternations; lastgroup names pick the handler
+_PRAW_MSG_RE = re.compile(
+    r'(?P<ratelimit>ratelimit)'
+    r'|(?P<auth>invalid_credentials|unauthorized)'
+    r'|(?P<denied>subreddit_notallowed)'
+    r'|(?P<net>connection|timeout)'
+    r'|(?P<file>file not found|no such file)'
+)
+_GENERIC_MSG_RE = re.compile(
+    r'(?P<net>connection|timeout)'
+    r'|(?P<file>file not found|no such file)'
+)
+_MSG_HANDLERS = {
+    "ratelimit": lambda error: RedditAutomationError(
+        ErrorCode.RATE_LIMIT,
+        "Reddit API rate limit exceeded",
+        retry_after=300
+    ),
+    "auth": lambda error: RedditAutomationError(
+        ErrorCode.REDDIT_AUTH_FAILED,
+        "Invalid Reddit credentials"
+    ),
+    "denied": lambda error: RedditAutomationError(
+        ErrorCode.POSTING_DENIED,
+        "Not allowed to post in this subreddit"
+    ),
+    "net": lambda error: RedditAutomationError(
+        ErrorCode.NETWORK_ERROR,
+        "Network connection failed",
+        suggestions=["Check your internet connection", "Try again in a few minutes"]
+    ),
+    "file": lambda error: RedditAutomationError(
+        ErrorCode.FILE_ERROR,
+        "Required file not found",
+        details={"original_error": str(error)}
+    ),
+}
+
+# Severity classes for _log_error; frozensets give O(1) membership
+_CRITICAL_ERRORS = frozenset({ErrorCode.SYSTEM_ERROR, ErrorCode.DATABASE_ERROR})
+_WARNING_ERRORS = frozenset({ErrorCode.RATE_LIMIT, ErrorCode.VALIDATION_ERROR})
+
+class _LazyJSON:
+    """Defers context serialization to the listener thread's %s format"""
+    __slots__ = ('obj',)
+    
+    def __init__(self, obj):
+        self.obj = obj
+    
+    def __str__(self) -> str:
+        return _dumps(self.obj)
+
+# Active QueueListener for the RedditAutomation logger. Module-level so
+# re-configuration stops the previous listener thread instead of leaking
+# it, and so shutdown only ever stops a listener once.
+_log_listener = None
+
+def _stop_log_listener():
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+atexit.register(_stop_log_listener)
 
 class ErrorHandler:
     """Centralized error handling and logging"""
     
     def __init__(self, log_file: Optional[str] = None):
         self.setup_logging(log_file)
-        self.error_history = []
+        # Struct-of-arrays history: parallel bounded deques plus a running
+        # per-code counter, instead of one throwaway dict per record
+        self._hist_codes = deque(maxlen=10000)
+        self._hist_ts = deque(maxlen=10000)
+        self._hist_ctx = deque(maxlen=10000)
+        self._code_counts = Counter()
     
     def setup_logging(self, log_file: Optional[str] = None):
-        """Setup logging configuration"""
+        """Setup logging configuration (idempotent across reconfiguration)"""
+        global _log_listener
         log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         
         # Create logs directory if it doesn't exist
-        if log_file:
-            log_path = Path(log_file)
-            log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_file = log_file or 'logs/reddit_automation.log'
+        Path(log_file).parent.mkdir(parents=True, exist_ok=True)
         
-        # Configure logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format=log_format,
-            handlers=[
-                logging.FileHandler(log_file or 'logs/reddit_automation.log'),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        file_handler = logging.FileHandler(log_file)
+        if JsonFormatter is not None:
+            file_handler.setFormatter(JsonFormatter(
+                '%(asctime)s %(name)s %(levelname)s %(message)s',
+                json_default=str
+            ))
+        else:
+            file_handler.setFormatter(logging.Formatter(log_format))
+        # Console stays human-readable text
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter(log_format))
         
+        # Only the named logger is configured, and records stay on it:
+        # nothing attaches to root, so third-party libraries don't write
+        # to our file handle and our records don't duplicate through root
         self.logger = logging.getLogger('RedditAutomation')
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        
+        # Tear down any previous pipeline so reconfiguration swaps the
+        # log file instead of stacking handlers and listener threads
+        _stop_log_listener()
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+            handler.close()
+        
+        # Callers only enqueue records; a single background listener
+        # thread pays the disk/console write latency for them
+        self._log_queue = queue.Queue(-1)
+        self.logger.addHandler(logging.handlers.QueueHandler(self._log_queue))
+        self._listener = _log_listener = logging.handlers.QueueListener(
+            self._log_queue, file_handler, stream_handler, respect_handler_level=True
+        )
+        self._listener.start()
     
     def handle_error(self, 
                     error: Exception, 
@@ -202,11 +408,13 @@ class ErrorHandler:
         self._log_error(structured_error, context)
         
         # Add to error history
-        self.error_history.append({
-            "error": structured_error.to_dict(),
-            "context": context,
-            "timestamp": datetime.now()
-        })
+        if len(self._hist_codes) == self._hist_codes.maxlen:
+            # Appending below evicts the oldest record; keep the counter in step
+            self._code_counts[self._hist_codes[0]] -= 1
+        self._hist_codes.append(structured_error.code)
+        self._hist_ts.append(time.monotonic())
+        self._hist_ctx.append(context)
+        self._code_counts[structured_error.code] += 1
         
         return structured_error
     
@@ -218,24 +426,115 @@ class ErrorHandler:
         error_str = str(error).lower()
         error_type = type(error).__name__
         
-        # Default system error
+        # Reddit API errors, dispatched on HTTP status
+        response = getattr(error, 'response', None)
+        status_code = getattr(response, 'status_code', None)
+        build = _STATUS_MAP.get(status_code)
+        if build is not None:
+            return build(error, status_code)
+        
+        # PRAW/network/file errors, selected by a single regex scan
+        msg_re = _PRAW_MSG_RE if "praw" in error_type.lower() else _GENERIC_MSG_RE
+        match = msg_re.search(error_str)
+        if match is not None:
+            return _MSG_HANDLERS[match.lastgroup](error)
+        
+        # Default system error. format_exc walks every frame and builds a
+        # multi-KB string, so only capture it when DEBUG logging will
+        # actually record it.
+        details = {"error_type": error_type}
+        if self.logger.isEnabledFor(logging.DEBUG):
+            details["traceback"] = traceback.format_exc()
         return RedditAutomationError(
             ErrorCode.SYSTEM_ERROR,
             f"Unexpected error: {str(error)}",
-            details={
-                "error_type": error_type,
-                "traceback": traceback.format_exc()
-            }
+            details=details
         )
     
     def _log_error(self, error: RedditAutomationError, context: Optional[Dict[str, Any]] = None):
         """Log error with appropriate level"""
-        log_message = f"[{error.code.value}] {error.message}"
+        code = error.code
+        if code in _CRITICAL_ERRORS:
+            level = logging.ERROR
+        elif code in _WARNING_ERRORS:
+            level = logging.WARNING
+        else:
+            level = logging.INFO
         
+        # Records that would be filtered cost nothing; %s arguments keep
+        # message assembly and JSON encoding on the listener thread
+        if not self.logger.isEnabledFor(level):
+            return
         if context:
-            log_message += f" | Context: {json.dumps(context, default=str)}"
+            self.logger.log(level, "[%s] %s | Context: %s", code.value, error.message, _LazyJSON(context))
+        else:
+            self.logger.log(level, "[%s] %s", code.value, error.message)
+    
+    def get_error_summary(self, hours: int = 24) -> Dict[str, Any]:
+        """Get summary of recent errors"""
+        # Timestamps are appended monotonically, so the window boundary
+        # is a bisect rather than a scan of the whole history
+        cutoff = time.monotonic() - hours * 3600
+        start = bisect.bisect_right(self._hist_ts, cutoff)
+        
+        if start == 0:
+            # Whole retained history is in the window - reuse the counter
+            error_counts = {code.value: count for code, count in self._code_counts.items() if count}
+        else:
+            window = Counter(islice(self._hist_codes, start, None))
+            error_counts = {code.value: count for code, count in window.items()}
         
-        self.logger.error(log_message)
+        return {
+            "total_errors": len(self._hist_ts) - start,
+            "error_counts": error_counts,
+            "most_common": max(error_counts.items(), key=lambda x: x[1]) if error_counts else None,
+            "period_hours": hours
+        }
+
+# Decorators for error handling
+def handle_reddit_errors(func):
+    """Decorator to handle Reddit API errors"""
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            error_handler = get_error_handler()
+            raise error_handler.handle_error(e, context={"function": func.__name__})
+    return wrapper
+
+def handle_ai_errors(func):
+    """Decorator to handle AI API errors"""
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            error_handler = get_error_handler()
+            if "groq" in str(e).lower() or "api" in str(e).lower():
+                structured_error = RedditAutomationError(
+                    ErrorCode.AI_API_ERROR,
+                    f"AI service error: {str(e)}"
+                )
+                raise error_handler.handle_error(structured_error, context={"function": func.__name__})
+            else:
+                raise error_handler.handle_error(e, context={"function": func.__name__})
+    return wrapper
+
+def handle_validation_errors(func):
+    """Decorator to handle validation errors"""
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except ValueError as e:
+            error_handler = get_error_handler()
+            structured_error = RedditAutomationError(
+                ErrorCode.VALIDATION_ERROR,
+                f"Validation failed: {str(e)}"
+            )
+            raise error_handler.handle_error(structured_error, context={"function": func.__name__})
+        except Exception as e:
+            error_handler = get_error_handler()
+            raise error_handler.handle_error(e, context={"function": func.__name__})
+    return wrapper
 
 # Global error handler instance
 _error_handler = None
@@ -259,17 +558,17 @@ def display_error_to_user(error: RedditAutomationError) -> str:
     output.append(f"ERROR: {error.user_message}")
     
     if error.suggestions:
-        output.append("\\nSuggestions:")
+        output.append("\nSuggestions:")
         for suggestion in error.suggestions:
             output.append(f"   • {suggestion}")
     
     if error.help_url:
-        output.append(f"\\nHelp: {error.help_url}")
+        output.append(f"\nHelp: {error.help_url}")
     
     if error.retry_after:
-        output.append(f"\\nPlease wait {error.retry_after} seconds before retrying")
+        output.append(f"\nPlease wait {error.retry_after} seconds before retrying")
     
-    return "\\n".join(output)
+    return "\n".join(output)
 
 def get_error_recovery_steps(error: RedditAutomationError) -> List[str]:
     """Get recovery steps for an error"""
@@ -284,6 +583,11 @@ def get_error_recovery_steps(error: RedditAutomationError) -> List[str]:
             "Verify your Reddit API credentials at https://www.reddit.com/prefs/apps",
             "Make sure you created a 'script' type application",
             "Re-run the setup wizard if needed"
+        ],
+        ErrorCode.RATE_LIMIT: [
+            f"Wait {error.retry_after or 300} seconds",
+            "Reduce the frequency of your requests",
+            "Consider using the built-in scheduling features"
         ]
     }
     
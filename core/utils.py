@@ -1,39 +1,62 @@
 """
 Utility functions
 """
+import functools
+import random
 import re
+from types import MappingProxyType
 from typing import Dict, Optional, List
 
+# Module-private RNG: isolates state from the global random instance and
+# saves the module attribute lookup on every draw
+_rng = random.Random()
+
+# Accept specific tech/blog domains, or a "blog." host ending in .com/.org.
+# Compiled once at import - validate_medium_url runs on every keystroke in
+# the dashboard URL input.
+_URL_RE = re.compile(
+    r"medium\.com|towardsdatascience\.com|hackernoon\.com|dev\.to|substack\.com"
+    r"|^(?=.*blog\.)(?=.*\.(?:com|org))",
+    re.IGNORECASE | re.DOTALL,
+)
+
 def validate_medium_url(url: str) -> bool:
     if not url:
         return False
-    # Accept specific tech/blog domains only
-    valid_domains = [
-        "medium.com", "towardsdatascience.com", "hackernoon.com", 
-        "dev.to", "substack.com"
-    ]
-    url_lower = url.lower()
-    # Check if URL contains valid domains and has proper structure
-    has_valid_domain = any(domain in url_lower for domain in valid_domains)
-    has_blog_pattern = "blog." in url_lower and (".com" in url_lower or ".org" in url_lower)
-    
-    return has_valid_domain or has_blog_pattern
+    return _URL_RE.search(url) is not None
 
+@functools.lru_cache(maxsize=512)
 def extract_article_info(url: str) -> Optional[Dict]:
-    return {
+    # Cached per URL so generating posts for N subreddits fetches once.
+    # Read-only view: every caller shares the cached entry, so mutation
+    # by one would silently leak into the rest; invalidate with
+    # extract_article_info.cache_clear() instead.
+    return MappingProxyType({
         "title": "Sample Article",
         "description": "This is a sample article description",
         "url": url
-    }
+    })
+
+# Splitting on the comma and its surrounding whitespace in one pass
+# replaces the per-token .strip() calls with a single C-level scan
+_SUBREDDIT_SPLIT = re.compile(r"\s*,\s*")
 
 def validate_subreddit_list(subreddits: str) -> List[str]:
     if not subreddits:
         return []
-    return [s.strip() for s in subreddits.split(",") if s.strip()]
+    return [s for s in _SUBREDDIT_SPLIT.split(subreddits.strip()) if s]
 
 def get_optimal_posting_time() -> str:
     return "Now"
 
 def calculate_random_delay(min_minutes: int = 30, max_minutes: int = 180) -> int:
-    import random
-    return random.randint(min_minutes, max_minutes)
+    return _rng.randint(min_minutes, max_minutes)
+
+def calculate_random_delays(n: int, min_minutes: int = 30, max_minutes: int = 180):
+    """Draw n delays in one vectorized call for bulk schedule planning.
+
+    Returns a numpy int array; numpy is imported lazily so the common
+    single-delay path keeps utils cheap to import.
+    """
+    import numpy as np
+    return np.random.default_rng().integers(min_minutes, max_minutes + 1, size=n)
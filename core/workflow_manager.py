@@ -4,6 +4,7 @@ Orchestrates the entire process from URL to posted content
 """
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
@@ -11,8 +12,19 @@ from dataclasses import dataclass
 from core.enhanced_subreddit_recommender import get_enhanced_subreddit_recommender
 from core.enhanced_reddit_client import get_enhanced_reddit_client
 from core.database import get_database
+from core.error_handling import get_error_handler
 from core.utils import validate_medium_url
 
+# Small pool for off-thread persistence so SQLite writes don't block
+# the caller (e.g. the dashboard render path after a successful post)
+_IO_POOL = ThreadPoolExecutor(max_workers=2)
+
+def _log_history_write_failure(future):
+    """Surface off-thread history-write failures instead of dropping them"""
+    exc = future.exception()
+    if exc is not None:
+        get_error_handler().handle_error(exc, context={"operation": "add_post_history"})
+
 @dataclass
 class WorkflowStep:
     step_name: str
@@ -99,25 +111,35 @@ class RedditAutomationWorkflow:
             
             generated_posts = []
             target_subreddits = [selected_subreddit] if selected_subreddit else [rec.name for rec in recommendations[:3]]
-            
-            for subreddit_name in target_subreddits:
-                try:
-                    post_data = self.recommender.generate_policy_compliant_post(
+
+            # Each generation is I/O-bound (Groq API), so fan out across
+            # threads - wall time becomes max() instead of sum() per subreddit
+            with ThreadPoolExecutor(max_workers=min(6, len(target_subreddits))) as executor:
+                futures = {
+                    executor.submit(
+                        self.recommender.generate_policy_compliant_post,
                         article_url, subreddit_name, content_analysis
-                    )
-                    
-                    if post_data.get('success'):
-                        generated_posts.append({
-                            "subreddit": subreddit_name,
-                            "title": post_data['title'],
-                            "body": post_data['body'],
-                            "compliance_notes": post_data.get('compliance_notes', []),
-                            "required_flair": post_data.get('required_flair', ''),
-                            "posting_tips": post_data.get('posting_tips', [])
-                        })
-                    
-                except Exception as e:
-                    print(f"Failed to generate post for r/{subreddit_name}: {e}")
+                    ): subreddit_name
+                    for subreddit_name in target_subreddits
+                }
+
+                for future in as_completed(futures):
+                    subreddit_name = futures[future]
+                    try:
+                        post_data = future.result()
+
+                        if post_data.get('success'):
+                            generated_posts.append({
+                                "subreddit": subreddit_name,
+                                "title": post_data['title'],
+                                "body": post_data['body'],
+                                "compliance_notes": post_data.get('compliance_notes', []),
+                                "required_flair": post_data.get('required_flair', ''),
+                                "posting_tips": post_data.get('posting_tips', [])
+                            })
+
+                    except Exception as e:
+                        print(f"Failed to generate post for r/{subreddit_name}: {e}")
             
             if not generated_posts:
                 step.status = "failed"
@@ -220,6 +242,130 @@ class RedditAutomationWorkflow:
             
             return WorkflowResult(False, self.workflow_id, steps, error_message=str(e))
     
+    def stream_workflow(self, article_url: str, max_subreddits: int = 6):
+        """Execute the workflow as a generator, yielding after each step.
+
+        Yields ("step", WorkflowStep) tuples as each stage completes so the
+        UI can render incrementally, then a final ("result", WorkflowResult).
+        """
+        self.workflow_id = f"workflow_{int(time.time())}"
+        steps = []
+
+        try:
+            # Step 1: Validate URL
+            step = WorkflowStep("URL Validation", "running", timestamp=datetime.now())
+            steps.append(step)
+
+            if not validate_medium_url(article_url):
+                step.status = "failed"
+                step.error_message = "Invalid article URL"
+                yield ("step", step)
+                yield ("result", WorkflowResult(False, self.workflow_id, steps, error_message="Invalid URL"))
+                return
+
+            step.status = "completed"
+            step.result = {"url": article_url, "valid": True}
+            yield ("step", step)
+
+            # Step 2: Analyze Content
+            step = WorkflowStep("Content Analysis", "running", timestamp=datetime.now())
+            steps.append(step)
+
+            content_analysis = self.recommender.analyze_article_content(article_url)
+
+            step.status = "completed"
+            step.result = content_analysis
+            yield ("step", step)
+
+            # Step 3: Get Subreddit Recommendations
+            step = WorkflowStep("Subreddit Recommendations", "running", timestamp=datetime.now())
+            steps.append(step)
+
+            recommendations = self.recommender.recommend_subreddits(article_url, max_subreddits)
+
+            if not recommendations:
+                step.status = "failed"
+                step.error_message = "No suitable subreddits found"
+                yield ("step", step)
+                yield ("result", WorkflowResult(False, self.workflow_id, steps, error_message="No subreddits found"))
+                return
+
+            recommendations_data = [
+                {
+                    "name": rec.name,
+                    "score": rec.overall_score,
+                    "risk": rec.risk_level,
+                    "why": rec.why_recommended,
+                    "subscribers": rec.subscribers,
+                    "rules": rec.posting_rules,
+                    "flair": rec.required_flair
+                }
+                for rec in recommendations
+            ]
+
+            step.status = "completed"
+            step.result = {"recommendations": recommendations_data}
+            yield ("step", step)
+
+            # Step 4 + 5: Generate and validate posts, yielding one at a time
+            step = WorkflowStep("Post Generation", "running", timestamp=datetime.now())
+            steps.append(step)
+
+            generated_posts = []
+            for rec in recommendations[:3]:
+                try:
+                    post_data = self.recommender.generate_policy_compliant_post(
+                        article_url, rec.name, content_analysis
+                    )
+
+                    if post_data.get('success'):
+                        post = {
+                            "subreddit": rec.name,
+                            "title": post_data['title'],
+                            "body": post_data['body'],
+                            "compliance_notes": post_data.get('compliance_notes', []),
+                            "required_flair": post_data.get('required_flair', ''),
+                            "posting_tips": post_data.get('posting_tips', [])
+                        }
+                        post['validation'] = self.reddit_client.validate_post_before_submission(
+                            post['subreddit'], post['title'], post['body'], post['required_flair']
+                        )
+                        generated_posts.append(post)
+                        yield ("post", post)
+
+                except Exception as e:
+                    print(f"Failed to generate post for r/{rec.name}: {e}")
+
+            if not generated_posts:
+                step.status = "failed"
+                step.error_message = "Failed to generate any posts"
+                yield ("step", step)
+                yield ("result", WorkflowResult(False, self.workflow_id, steps, error_message="Post generation failed"))
+                return
+
+            step.status = "completed"
+            step.result = {"generated_posts": generated_posts}
+            yield ("step", step)
+
+            final_result = {
+                "workflow_id": self.workflow_id,
+                "article_url": article_url,
+                "content_analysis": content_analysis,
+                "recommendations": recommendations_data,
+                "generated_posts": generated_posts,
+                "posting_result": None,
+                "timestamp": datetime.now().isoformat()
+            }
+
+            yield ("result", WorkflowResult(True, self.workflow_id, steps, final_result))
+
+        except Exception as e:
+            if steps and steps[-1].status == "running":
+                steps[-1].status = "failed"
+                steps[-1].error_message = str(e)
+
+            yield ("result", WorkflowResult(False, self.workflow_id, steps, error_message=str(e)))
+
     def get_workflow_summary(self, workflow_result: WorkflowResult) -> Dict:
         """Get a summary of the workflow results"""
         if not workflow_result.success:
@@ -254,6 +400,16 @@ class RedditAutomationWorkflow:
         
         return recommendations[0]  # Already sorted by score
     
+    def _save_history_async(self, **kwargs):
+        """Persist a history row off-thread without losing failures.
+
+        Returns the future so callers that refresh history views can wait
+        for the row to land; write errors are logged via the done-callback.
+        """
+        future = _IO_POOL.submit(self.database.add_post_history, **kwargs)
+        future.add_done_callback(_log_history_write_failure)
+        return future
+
     def post_to_selected_subreddit(self, workflow_result: WorkflowResult, subreddit_name: str) -> Dict:
         """Post to a specific subreddit from workflow results"""
         if not workflow_result.success:
@@ -282,24 +438,26 @@ class RedditAutomationWorkflow:
         )
         
         if posting_result.success:
-            # Save to database
-            self.database.add_post_history(
+            # Save to database off-thread so the caller can render immediately
+            history_write = self._save_history_async(
                 article_url=workflow_result.final_result["article_url"],
                 title=target_post['title'],
                 content=target_post['body'],
                 subreddit=subreddit_name,
                 status="posted_successfully"
             )
-            
+
             return {
                 "success": True,
                 "post_id": posting_result.post_id,
                 "post_url": posting_result.post_url,
-                "subreddit": subreddit_name
+                "subreddit": subreddit_name,
+                # Callers that refresh history views can wait on this
+                "history_write": history_write
             }
         else:
-            # Save failed attempt
-            self.database.add_post_history(
+            # Save failed attempt off-thread
+            self._save_history_async(
                 article_url=workflow_result.final_result["article_url"],
                 title=target_post['title'],
                 content=target_post['body'],